@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -16,6 +17,7 @@ from app.routers import (
 )
 from app.models import Database
 from app.config import config
+from app.schemas.job_queue import RUNNING
 from app.middleware import (
     RequestIDMiddleware,
     http_exception_handler,
@@ -23,14 +25,20 @@ from app.middleware import (
     general_exception_handler
 )
 import os
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from pymongo.errors import OperationFailure
+
+# Configure logging; records are queued and written by a listener thread so
+# log I/O never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -41,7 +49,9 @@ config.validate_or_exit()
 app = FastAPI(
     title="Jobly API",
     description="AI Job Hunter Agent - Profile Management, Job Ingestion, Matching, Interview Prep & Application Tracking",
-    version="7.0.0"
+    version="7.0.0",
+    # Encode response bodies with orjson instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Add request ID middleware
@@ -93,6 +103,35 @@ async def shutdown_event():
     logger.info("Shutting down Jobly API...")
     await Database.close()
     logger.info("Database connection closed")
+    _log_listener.stop()
+
+
+async def ensure_jobs_dedupe_index(jobs_col):
+    """
+    Replace the legacy unique content_hash index with the dedupe_hash one
+    
+    Errors are logged here rather than raised, so existing duplicate jobs
+    don't stop the remaining indexes from being created.
+    
+    Args:
+        jobs_col: Jobs collection
+    """
+    # Jobs no longer store content_hash, so on databases indexed before the
+    # switch every insert after the first would collide on a null key
+    try:
+        await jobs_col.drop_index("content_hash_1")
+        logger.info("Dropped legacy content_hash index on jobs")
+    except OperationFailure as e:
+        if e.code != 27:  # IndexNotFound
+            logger.warning(f"Error dropping legacy content_hash index on jobs: {e}")
+    
+    try:
+        await jobs_col.create_index([("dedupe_hash", 1)], unique=True)
+    except Exception as e:
+        logger.error(
+            f"Error creating unique dedupe_hash index on jobs "
+            f"(duplicate jobs must be removed first): {e}"
+        )
 
 
 async def create_indexes():
@@ -105,13 +144,18 @@ async def create_indexes():
         
         # Background jobs indexes
         jobs_col = db["background_jobs"]
+        # acquire_job: queued jobs in FIFO order, and running jobs with expired locks
         await jobs_col.create_index([("status", 1), ("created_at", 1)])
+        await jobs_col.create_index(
+            [("status", 1), ("lock_expires_at", 1)],
+            partialFilterExpression={"status": RUNNING}
+        )
         await jobs_col.create_index([("user_id", 1), ("created_at", -1)])
         await jobs_col.create_index([("type", 1)])
         
         # Jobs indexes
         jobs_db_col = db["jobs"]
-        await jobs_db_col.create_index([("content_hash", 1)], unique=True)
+        await ensure_jobs_dedupe_index(jobs_db_col)
         await jobs_db_col.create_index([("posted_date", -1)])
         await jobs_db_col.create_index([("remote_type", 1)])
         
@@ -119,6 +163,7 @@ async def create_indexes():
         matches_col = db["matches"]
         await matches_col.create_index([("profile_id", 1), ("score_total", -1)])
         await matches_col.create_index([("job_id", 1)])
+        await matches_col.create_index([("profile_id", 1), ("job_id", 1)])
         
         # Packets indexes
         packets_col = db["packets"]
@@ -135,6 +180,10 @@ async def create_indexes():
         await events_col.create_index([("user_id", 1), ("timestamp", -1)])
         await events_col.create_index([("timestamp", 1)], expireAfterSeconds=EVENTS_TTL_SECONDS)
         
+        # Embedding cache index (lookups are by cache_key, one doc per key)
+        embeddings_col = db["embeddings"]
+        await embeddings_col.create_index([("cache_key", 1)], unique=True)
+        
         logger.info("Database indexes created successfully")
     except Exception as e:
         logger.warning(f"Error creating indexes (may already exist): {e}")
@@ -195,9 +244,7 @@ async def readyz():
             "database": "connected"
         }
     except Exception as e:
-        from fastapi import Response
-        return Response(
-            content='{"status": "not ready", "error": "' + str(e) + '"}',
-            status_code=503,
-            media_type="application/json"
+        return ORJSONResponse(
+            content={"status": "not ready", "error": str(e)},
+            status_code=503
         )
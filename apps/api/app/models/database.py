@@ -1,4 +1,4 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from typing import Optional
 import os
 from dotenv import load_dotenv
@@ -7,13 +7,13 @@ load_dotenv()
 
 
 class Database:
-    client: Optional[AsyncIOMotorClient] = None
+    client: Optional[AsyncMongoClient] = None
     
     @classmethod
-    def get_client(cls) -> AsyncIOMotorClient:
+    def get_client(cls) -> AsyncMongoClient:
         if cls.client is None:
             mongodb_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
-            cls.client = AsyncIOMotorClient(mongodb_uri)
+            cls.client = AsyncMongoClient(mongodb_uri)
         return cls.client
     
     @classmethod
@@ -24,7 +24,7 @@ class Database:
     @classmethod
     async def close(cls):
         if cls.client is not None:
-            cls.client.close()
+            await cls.client.close()
             cls.client = None
 
 
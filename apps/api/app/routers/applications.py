@@ -36,8 +36,7 @@ async def get_packet_by_id(packet_id: str) -> PacketInDB:
     if not packet_data:
         raise HTTPException(status_code=404, detail="Packet not found")
     
-    packet_data["_id"] = str(packet_data["_id"])
-    return PacketInDB(**packet_data)
+    return PacketInDB.from_mongo(packet_data)
 
 
 async def get_job_by_id(job_id: str) -> JobPosting:
@@ -88,8 +87,7 @@ async def create_application(request: CreateApplicationRequest):
     })
     
     if existing:
-        existing["_id"] = str(existing["_id"])
-        return ApplicationInDB(**existing)
+        return ApplicationInDB.from_mongo(existing)
     
     # Create application
     application = Application(
@@ -113,9 +111,8 @@ async def create_application(request: CreateApplicationRequest):
     
     # Retrieve and return
     app_data = await collection.find_one({"_id": result.inserted_id})
-    app_data["_id"] = str(app_data["_id"])
     
-    return ApplicationInDB(**app_data)
+    return ApplicationInDB.from_mongo(app_data)
 
 
 @router.get("", response_model=List[ApplicationInDB])
@@ -141,8 +138,7 @@ async def list_applications(
     applications = []
     
     async for app_data in cursor:
-        app_data["_id"] = str(app_data["_id"])
-        applications.append(ApplicationInDB(**app_data))
+        applications.append(ApplicationInDB.from_mongo(app_data))
     
     return applications
 
@@ -160,8 +156,7 @@ async def get_application(application_id: str):
     if not app_data:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    app_data["_id"] = str(app_data["_id"])
-    return ApplicationInDB(**app_data)
+    return ApplicationInDB.from_mongo(app_data)
 
 
 @router.patch("/{application_id}/status", response_model=ApplicationInDB)
@@ -207,6 +202,5 @@ async def update_application_status(
     
     # Retrieve and return
     app_data = await collection.find_one({"_id": ObjectId(application_id)})
-    app_data["_id"] = str(app_data["_id"])
     
-    return ApplicationInDB(**app_data)
+    return ApplicationInDB.from_mongo(app_data)
@@ -41,7 +41,7 @@ async def create_job(request: JobCreateRequest):
     )
 
 
-@router.get("", response_model=JobListResponse)
+@router.get("", response_model=JobListResponse, response_model_exclude_none=True)
 async def list_jobs(
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     job_type: Optional[JobType] = Query(None, description="Filter by job type"),
@@ -69,7 +69,7 @@ async def list_jobs(
     )
 
 
-@router.get("/{job_id}", response_model=BackgroundJobInDB)
+@router.get("/{job_id}", response_model=BackgroundJobInDB, response_model_exclude_none=True)
 async def get_job(job_id: str):
     """
     Get a specific job by ID.
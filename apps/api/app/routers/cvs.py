@@ -37,11 +37,7 @@ async def list_cvs(user_email: str = Query(..., description="User email")):
         
         cvs = []
         async for cv_doc in cursor:
-            # Convert MongoDB _id to string and map to id field
-            if "_id" in cv_doc:
-                cv_doc["id"] = str(cv_doc["_id"])
-                del cv_doc["_id"]
-            cvs.append(CVDocumentInDB(**cv_doc))
+            cvs.append(CVDocumentInDB.from_mongo(cv_doc))
         
         return CVListResponse(
             cvs=cvs,
@@ -182,11 +178,7 @@ async def get_active_cv(user_email: str = Query(..., description="User email")):
                 {"$set": {"is_active": True}}
             )
         
-        # Convert MongoDB _id to string
-        cv_doc["id"] = str(cv_doc["_id"])
-        del cv_doc["_id"]
-        
-        return CVDocumentInDB(**cv_doc)
+        return CVDocumentInDB.from_mongo(cv_doc)
     
     except HTTPException:
         raise
@@ -9,7 +9,7 @@ from app.schemas.interview import (
     InterviewPackInDB,
     TechnicalQAInDB
 )
-from app.schemas.job_queue import JobType, JobResponse
+from app.schemas.job_queue import INTERVIEW_GENERATION, JobResponse
 from app.models.database import (
     get_packets_collection,
     get_profiles_collection,
@@ -20,7 +20,7 @@ from app.models.database import (
 from app.services.interview_prep import InterviewPrepService
 from app.services.job_service import JobService
 from app.services.sse_service import sse_service
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_CREATED
 from app.schemas.packet import PacketInDB
 from app.schemas.profile import UserProfile
 from app.schemas.job import JobPostingInDB
@@ -47,21 +47,21 @@ async def generate_interview_materials(
     # Create background job
     job_service = JobService()
     job = await job_service.create_job(
-        job_type=JobType.INTERVIEW_GENERATION,
+        job_type=INTERVIEW_GENERATION,
         params={"packet_id": packet_id},
     )
     
     # Emit job created event
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_CREATED,
-        data={
+    await sse_service.emit({
+        "type": JOB_CREATED,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "status": job.status,
             "message": "Interview generation queued"
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     return JobResponse(
         job_id=job.id,
@@ -71,7 +71,7 @@ async def generate_interview_materials(
     )
 
 
-@router.get("/{packet_id}")
+@router.get("/{packet_id}", response_model=InterviewPackResponse, response_model_exclude_none=True)
 async def get_interview_materials(packet_id: str):
     """
     Retrieve interview materials for a packet
@@ -98,7 +98,7 @@ async def get_interview_materials(packet_id: str):
         )
     
     return InterviewPackResponse(
-        interview_pack=InterviewPackInDB(**pack_doc),
-        technical_qa=TechnicalQAInDB(**qa_doc),
+        interview_pack=InterviewPackInDB.from_mongo(pack_doc),
+        technical_qa=TechnicalQAInDB.from_mongo(qa_doc),
         message="Interview materials retrieved successfully"
     )
@@ -11,14 +11,14 @@ from app.schemas import (
     JobPostingResponse,
     JobListResponse,
     IngestResponse,
-    JobType,
     JobResponse,
 )
+from app.schemas.job_queue import JOB_INGESTION
 from app.models.database import Database
 from app.services.job_ingestion import JobIngestionService
 from app.services.job_service import JobService
 from app.services.sse_service import sse_service
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_CREATED
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -35,21 +35,21 @@ async def ingest_jobs():
         
         # Create background job
         job = await job_service.create_job(
-            job_type=JobType.JOB_INGESTION,
+            job_type=JOB_INGESTION,
             params={},
         )
         
         # Emit job created event
-        await sse_service.emit(SSEEvent(
-            event_type=EventType.JOB_CREATED,
-            data={
+        await sse_service.emit({
+            "type": JOB_CREATED,
+            "data": {
                 "job_id": job.id,
                 "type": job.type,
                 "status": job.status,
                 "message": "Job ingestion queued"
             },
-            user_id=job.user_id
-        ))
+            "user_id": job.user_id
+        })
         
         return JobResponse(
             job_id=job.id,
@@ -135,14 +135,14 @@ async def list_jobs(
         
         # Get paginated results
         skip = (page - 1) * per_page
-        cursor = jobs_collection.find(query).sort(sort_field, sort_direction).skip(skip).limit(per_page)
+        # Stored match embeddings aren't part of the API response
+        cursor = jobs_collection.find(
+            query, projection={"embedding_vec": 0}
+        ).sort(sort_field, sort_direction).skip(skip).limit(per_page)
         
         jobs = []
         async for job_doc in cursor:
-            # Convert MongoDB _id to string
-            if "_id" in job_doc:
-                job_doc["_id"] = str(job_doc["_id"])
-            jobs.append(JobPostingInDB(**job_doc))
+            jobs.append(JobPostingInDB.from_mongo(job_doc))
         
         return JobListResponse(
             jobs=jobs,
@@ -171,16 +171,15 @@ async def get_job(job_id: str):
         jobs_collection = db["jobs"]
         
         # Find job by ID
-        job_doc = await jobs_collection.find_one({"_id": ObjectId(job_id)})
+        job_doc = await jobs_collection.find_one(
+            {"_id": ObjectId(job_id)}, projection={"embedding_vec": 0}
+        )
         
         if not job_doc:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        # Convert MongoDB _id to string
-        job_doc["_id"] = str(job_doc["_id"])
-        
         return JobPostingResponse(
-            job=JobPostingInDB(**job_doc),
+            job=JobPostingInDB.from_mongo(job_doc),
             message="Job retrieved successfully"
         )
         
@@ -10,11 +10,11 @@ from app.schemas.match import (
     MatchWithJob,
     MatchInDB,
 )
-from app.schemas.job_queue import JobType, JobResponse
+from app.schemas.job_queue import MATCH_RECOMPUTE, JobResponse
 from app.services.matching.match_service import MatchGenerationService
 from app.services.job_service import JobService
 from app.services.sse_service import sse_service
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_CREATED
 from app.models.database import get_matches_collection, get_jobs_collection, get_profiles_collection
 
 router = APIRouter(prefix="/matches", tags=["matches"])
@@ -46,21 +46,21 @@ async def recompute_matches():
     # Create background job
     job_service = JobService()
     job = await job_service.create_job(
-        job_type=JobType.MATCH_RECOMPUTE,
+        job_type=MATCH_RECOMPUTE,
         params={"profile_id": profile_id},
     )
     
     # Emit job created event
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_CREATED,
-        data={
+    await sse_service.emit({
+        "type": JOB_CREATED,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "status": job.status,
             "message": "Match recompute queued"
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     return JobResponse(
         job_id=job.id,
@@ -123,11 +123,13 @@ async def list_matches(
     results = []
     for match_doc in match_docs:
         # Convert match
-        match_doc["id"] = str(match_doc["_id"])
-        match = MatchInDB(**match_doc)
+        match = MatchInDB.from_mongo(match_doc)
         
         # Get job
-        job_doc = await jobs_collection.find_one({"_id": ObjectId(match.job_id)})
+        # Stored match embeddings aren't part of the API response
+        job_doc = await jobs_collection.find_one(
+            {"_id": ObjectId(match.job_id)}, projection={"embedding_vec": 0}
+        )
         
         if not job_doc:
             continue  # Skip if job was deleted
@@ -203,12 +205,14 @@ async def get_match(job_id: str):
         raise HTTPException(status_code=404, detail="Match not found")
     
     # Convert match
-    match_doc["id"] = str(match_doc["_id"])
-    match = MatchInDB(**match_doc)
+    match = MatchInDB.from_mongo(match_doc)
     
     # Get job
     jobs_collection = get_jobs_collection()
-    job_doc = await jobs_collection.find_one({"_id": ObjectId(job_id)})
+    # Stored match embeddings aren't part of the API response
+    job_doc = await jobs_collection.find_one(
+        {"_id": ObjectId(job_id)}, projection={"embedding_vec": 0}
+    )
     
     if job_doc:
         job_doc["id"] = str(job_doc["_id"])
@@ -12,7 +12,7 @@ from app.schemas.packet import (
     PacketInDB,
     TailoringPlan,
 )
-from app.schemas.job_queue import JobType, JobResponse
+from app.schemas.job_queue import PACKET_GENERATION, JobResponse
 from app.schemas.profile import UserProfile
 from app.schemas.job import JobPosting
 from app.models.database import get_profiles_collection, get_jobs_collection
@@ -20,7 +20,7 @@ from app.services.tailoring import TailoringService
 from app.services.packet_storage import PacketStorageService
 from app.services.job_service import JobService
 from app.services.sse_service import sse_service
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_CREATED
 from bson import ObjectId
 
 
@@ -71,7 +71,7 @@ async def generate_packet(request: GeneratePacketRequest):
     # Create background job
     job_service = JobService()
     job = await job_service.create_job(
-        job_type=JobType.PACKET_GENERATION,
+        job_type=PACKET_GENERATION,
         params={
             "job_id": request.job_id,
             "user_emphasis": request.user_emphasis,
@@ -79,16 +79,16 @@ async def generate_packet(request: GeneratePacketRequest):
     )
     
     # Emit job created event
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_CREATED,
-        data={
+    await sse_service.emit({
+        "type": JOB_CREATED,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "status": job.status,
             "message": "Packet generation queued"
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     return JobResponse(
         job_id=job.id,
@@ -98,7 +98,7 @@ async def generate_packet(request: GeneratePacketRequest):
     )
 
 
-@router.get("/{packet_id}", response_model=PacketResponse)
+@router.get("/{packet_id}", response_model=PacketResponse, response_model_exclude_none=True)
 async def get_packet(packet_id: str):
     """Get packet details by ID"""
     packet = await storage_service.get_packet(packet_id)
@@ -109,7 +109,7 @@ async def get_packet(packet_id: str):
     return PacketResponse(packet=packet)
 
 
-@router.get("", response_model=PacketListResponse)
+@router.get("", response_model=PacketListResponse, response_model_exclude_none=True)
 async def list_packets(
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
     job_id: Optional[str] = Query(None, description="Filter by job ID"),
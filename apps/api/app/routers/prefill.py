@@ -74,7 +74,7 @@ async def create_prefill_intent(request: PrefillIntentRequest):
     if not app_data:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    application = ApplicationInDB(**{**app_data, "_id": str(app_data["_id"])})
+    application = ApplicationInDB.from_mongo(app_data)
     
     # Get user profile for field mapping
     profile = await get_user_profile()
@@ -191,7 +191,7 @@ async def get_prefill_intent(
     if not intent_data:
         raise HTTPException(status_code=404, detail="Intent not found")
     
-    intent = PrefillIntentInDB(**{**intent_data, "_id": str(intent_data["_id"])})
+    intent = PrefillIntentInDB.from_mongo(intent_data)
     
     # Validate token
     if intent.auth_token != token_hash:
@@ -221,7 +221,7 @@ async def report_prefill_result(request: PrefillResultRequest):
     if not intent_data:
         raise HTTPException(status_code=404, detail="Intent not found")
     
-    intent = PrefillIntentInDB(**{**intent_data, "_id": str(intent_data["_id"])})
+    intent = PrefillIntentInDB.from_mongo(intent_data)
     
     # Validate token
     token_hash = hash_token(request.auth_token)
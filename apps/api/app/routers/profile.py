@@ -1,4 +1,4 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
 from app.schemas import (
     UserProfile,
@@ -6,18 +6,26 @@ from app.schemas import (
     UploadCVResponse,
     ProfileResponse,
     ProfileSaveResponse,
-    CVDocument,
-    CVDocumentResponse,
 )
 from app.services import CVExtractor
 from app.models import get_profiles_collection
 from app.models.database import get_cv_documents_collection
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 from typing import Optional
+import asyncio
+import os
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
+# Text extractor per supported CV file extension
+_EXTRACTORS = {
+    ".pdf": CVExtractor.extract_text_from_pdf,
+    ".docx": CVExtractor.extract_text_from_docx,
+    ".doc": CVExtractor.extract_text_from_docx,
+}
+
 
 def _should_update_field(key: str, value: any, is_update: bool) -> bool:
     """
@@ -51,8 +59,27 @@ def _should_update_field(key: str, value: any, is_update: bool) -> bool:
     return True
 
 
+async def _mirror_profile(email: str, profile_dict: dict) -> None:
+    """
+    Mirror a CV-derived profile into the profiles collection.
+    
+    Kept for backward compatibility with clients that read from `profiles`.
+    Runs as a background task so the upload response doesn't wait on it.
+    
+    Args:
+        email: Email address identifying the profile
+        profile_dict: Profile data to upsert
+    """
+    profiles_collection = get_profiles_collection()
+    await profiles_collection.update_one(
+        {"email": email},
+        {"$set": profile_dict},
+        upsert=True
+    )
+
+
 @router.post("/upload-cv", response_model=UploadCVResponse)
-async def upload_cv(file: UploadFile = File(...)):
+async def upload_cv(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """
     Upload a CV file (PDF or DOCX) and extract profile information
     
@@ -71,18 +98,17 @@ async def upload_cv(file: UploadFile = File(...)):
         content = await file.read()
         
         # Determine file type and extract text
-        if file.filename.lower().endswith('.pdf'):
-            extracted_text, evidence_map = CVExtractor.extract_text_from_pdf(content)
-        elif file.filename.lower().endswith(('.docx', '.doc')):
-            extracted_text, evidence_map = CVExtractor.extract_text_from_docx(content)
-        else:
+        extractor = _EXTRACTORS.get(os.path.splitext(file.filename)[1].lower())
+        if extractor is None:
             raise HTTPException(
                 status_code=400,
                 detail="Unsupported file format. Please upload PDF or DOCX files."
             )
+        # PDF/DOCX parsing is CPU-bound; run it off the event loop
+        extracted_text, evidence = await asyncio.to_thread(extractor, content)
         
         # Create draft profile from extracted text
-        draft_profile = CVExtractor.create_draft_profile(extracted_text, evidence_map)
+        draft_profile = CVExtractor.create_draft_profile(extracted_text, evidence)
         
         # Store CV document in cv_documents collection
         cv_collection = get_cv_documents_collection()
@@ -93,32 +119,25 @@ async def upload_cv(file: UploadFile = File(...)):
             {"$set": {"is_active": False}}
         )
         
-        # Create new CV document
-        cv_document = CVDocument(
-            user_email=draft_profile.email,
-            filename=file.filename,
-            extracted_text=extracted_text,
-            parsed_profile=draft_profile.model_dump(),
-            is_active=True,  # New uploads are active by default
-            upload_date=datetime.utcnow()
-        )
-        
-        result = await cv_collection.insert_one(cv_document.model_dump())
+        # Dump the draft once; it is both the CV snapshot and the profile mirror
+        now = datetime.utcnow()
+        profile_dict = draft_profile.model_dump()
+        profile_dict["updated_at"] = now
+        
+        # Create new CV document (fields mirror CVDocument; the draft profile
+        # is already validated, so build the Mongo document directly)
+        result = await cv_collection.insert_one({
+            "user_email": draft_profile.email,
+            "filename": file.filename,
+            "extracted_text": extracted_text,
+            "parsed_profile": profile_dict,
+            "is_active": True,  # New uploads are active by default
+            "upload_date": now,
+        })
         cv_id = str(result.inserted_id)
         
         # Also save/update the profile in profiles collection (for backward compatibility)
-        profiles_collection = get_profiles_collection()
-        profile_dict = draft_profile.model_dump()
-        profile_dict["updated_at"] = datetime.utcnow()
-        
-        existing = await profiles_collection.find_one({"email": draft_profile.email})
-        if existing:
-            await profiles_collection.update_one(
-                {"email": draft_profile.email},
-                {"$set": profile_dict}
-            )
-        else:
-            await profiles_collection.insert_one(profile_dict)
+        background_tasks.add_task(_mirror_profile, draft_profile.email, profile_dict)
         
         return UploadCVResponse(
             extracted_text=extracted_text,
@@ -126,6 +145,8 @@ async def upload_cv(file: UploadFile = File(...)):
             message=f"CV processed successfully. CV ID: {cv_id}"
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing CV: {str(e)}")
 
@@ -186,6 +207,8 @@ async def save_profile(profile: UserProfile):
             message=f"Profile {action} successfully for {profile.email}"
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving profile: {str(e)}")
 
@@ -247,11 +270,6 @@ async def update_profile(email: str, updates: UserProfileUpdate):
     try:
         collection = get_profiles_collection()
         
-        # Get existing profile
-        existing = await collection.find_one({"email": email})
-        if not existing:
-            raise HTTPException(status_code=404, detail="Profile not found")
-        
         # Build update dict (only non-None fields)
         update_dict = {
             k: v for k, v in updates.model_dump(exclude_unset=True).items() 
@@ -261,14 +279,18 @@ async def update_profile(email: str, updates: UserProfileUpdate):
         # Add updated timestamp
         update_dict["updated_at"] = datetime.utcnow()
         
-        # Update profile
-        await collection.update_one(
+        # Update profile and fetch its id in a single round trip
+        updated = await collection.find_one_and_update(
             {"email": email},
-            {"$set": update_dict}
+            {"$set": update_dict},
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER
         )
+        if updated is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
         
         return ProfileSaveResponse(
-            profile_id=str(existing["_id"]),
+            profile_id=str(updated["_id"]),
             message="Profile updated successfully"
         )
     
@@ -293,40 +315,26 @@ async def save_preferences(email: str, preferences: dict):
     try:
         collection = get_profiles_collection()
         
-        # Get existing profile
-        existing = await collection.find_one({"email": email})
-        if not existing:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Profile not found for email: {email}"
-            )
-        
-        # Update preferences
-        result = await collection.update_one(
+        # Update preferences and fetch the profile id in a single round trip
+        updated = await collection.find_one_and_update(
             {"email": email},
             {
                 "$set": {
                     "preferences": preferences,
                     "updated_at": datetime.utcnow()
                 }
-            }
+            },
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER
         )
-        
-        if result.modified_count == 0:
-            # Check if preferences are the same
-            if existing.get("preferences") == preferences:
-                return ProfileSaveResponse(
-                    profile_id=str(existing["_id"]),
-                    message="Preferences unchanged (already up to date)"
-                )
-            else:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to update preferences"
-                )
+        if updated is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Profile not found for email: {email}"
+            )
         
         return ProfileSaveResponse(
-            profile_id=str(existing["_id"]),
+            profile_id=str(updated["_id"]),
             message="Preferences saved successfully"
         )
     
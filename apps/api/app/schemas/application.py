@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from .base import MongoIdMixin
 
 
 class ApplicationStatus(str, Enum):
@@ -41,12 +42,8 @@ class PrefillIntent(BaseModel):
     status: str = "pending"  # pending, in_progress, completed, failed
 
 
-class PrefillIntentInDB(PrefillIntent):
+class PrefillIntentInDB(MongoIdMixin, PrefillIntent):
     """PrefillIntent as stored in database"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class PrefillLog(BaseModel):
@@ -80,12 +77,8 @@ class PrefillLog(BaseModel):
     field_mappings: Dict[str, Dict[str, str]] = Field(default_factory=dict)  # canonical_field -> {selector, type}
 
 
-class PrefillLogInDB(PrefillLog):
+class PrefillLogInDB(MongoIdMixin, PrefillLog):
     """PrefillLog as stored in database"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class Application(BaseModel):
@@ -120,12 +113,8 @@ class Application(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
-class ApplicationInDB(Application):
+class ApplicationInDB(MongoIdMixin, Application):
     """Application as stored in database"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class CreateApplicationRequest(BaseModel):
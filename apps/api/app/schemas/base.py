@@ -0,0 +1,39 @@
+"""Shared building blocks for document schemas"""
+from pydantic import BaseModel, Field, AfterValidator, WithJsonSchema
+from typing import Annotated, Optional
+
+
+def _validate_email(value: str) -> str:
+    """Validate and normalize an email address, importing email-validator on first use"""
+    from pydantic.networks import validate_email
+    return validate_email(value)[1]
+
+
+# Same validation as EmailStr, but building a schema that uses it does not
+# import email-validator, so workers that never see an email skip that import
+Email = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+class MongoIdMixin(BaseModel):
+    """Optional MongoDB `_id`, exposed as `id`, for schemas read back from the database"""
+    
+    # Validated by name only; `_id` is mapped at the repository boundary
+    # (from_mongo) and restored on output for API clients.
+    id: Optional[str] = Field(default=None, serialization_alias="_id")
+    
+    @classmethod
+    def from_mongo(cls, doc: dict):
+        """
+        Build an instance from a raw MongoDB document.
+        
+        The ObjectId `_id` is stringified into `id` on a copy, so callers
+        can pass documents straight from the driver.
+        """
+        data = dict(doc)
+        if "_id" in data:
+            data["id"] = str(data.pop("_id"))
+        return cls.model_validate(data)
@@ -2,14 +2,14 @@
 CV Document schemas for multi-CV support
 """
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
+from .base import Email, MongoIdMixin
 
 
 class CVDocument(BaseModel):
     """CV document with extracted data"""
-    user_email: EmailStr
+    user_email: Email
     filename: str
     extracted_text: str
     parsed_profile: dict  # Snapshot of UserProfile as dict
@@ -17,21 +17,24 @@ class CVDocument(BaseModel):
     upload_date: datetime = Field(default_factory=datetime.utcnow)
 
 
-class CVDocumentInDB(CVDocument):
+class CVDocumentInDB(MongoIdMixin, CVDocument):
     """CV document as stored in MongoDB"""
-    id: Optional[str] = Field(None, alias="_id")
-    
-    model_config = ConfigDict(populate_by_name=True)
-    
+
 
 class CVDocumentResponse(BaseModel):
     """Response for CV document operations"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     cv_id: str
     message: str = "CV processed successfully"
 
 
 class CVListResponse(BaseModel):
     """Response for listing CVs"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     cvs: list[CVDocumentInDB]
     total: int
     message: str = "CVs retrieved successfully"
@@ -40,4 +43,4 @@ class CVListResponse(BaseModel):
 class SetActiveCVRequest(BaseModel):
     """Request to set active CV"""
     cv_id: str
-    user_email: EmailStr
+    user_email: Email
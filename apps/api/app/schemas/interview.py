@@ -1,25 +1,28 @@
 """Interview preparation schemas"""
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+from pydantic.dataclasses import dataclass
+from typing import List, Optional, Literal
 from datetime import datetime
-from enum import Enum
+from .base import MongoIdMixin
 
 
-class DifficultyLevel(str, Enum):
-    """Difficulty levels for technical questions"""
-    EASY = "easy"
-    MEDIUM = "medium"
-    HARD = "hard"
+# Difficulty levels for technical questions
+DifficultyLevel = Literal["easy", "medium", "hard"]
+EASY: DifficultyLevel = "easy"
+MEDIUM: DifficultyLevel = "medium"
+HARD: DifficultyLevel = "hard"
 
 
-class GroundingReference(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class GroundingReference:
     """Reference to existing experience/evidence in user profile"""
     experience_index: int  # Index in profile.experience list
     bullet_index: Optional[int] = None  # Index in role.bullets list, if applicable
     evidence_text: str  # Snippet of the referenced text for verification
 
 
-class STARStory(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class STARStory:
     """STAR format interview story grounded in real experience"""
     title: str  # Brief title/theme of the story
     situation: str  # Context/background
@@ -30,14 +33,16 @@ class STARStory(BaseModel):
     grounding_refs: List[GroundingReference] = Field(default_factory=list)  # References to profile experience
 
 
-class InterviewQuestion(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class InterviewQuestion:
     """Question to ask the interviewer"""
     question: str
     category: str  # e.g., "role", "team", "culture", "growth", "technical"
     reasoning: str  # Why this question is relevant for this specific job
 
 
-class StudyResource(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class StudyResource:
     """Study resource placeholder (no external links)"""
     topic: str
     resource_type: str  # e.g., "documentation", "tutorial", "practice problems"
@@ -78,7 +83,8 @@ class InterviewPack(BaseModel):
     schema_version: str = "1.0.0"
 
 
-class TechnicalQuestion(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TechnicalQuestion:
     """Technical interview question with answer and follow-ups"""
     question: str
     difficulty: DifficultyLevel
@@ -112,20 +118,12 @@ class TechnicalQA(BaseModel):
     schema_version: str = "1.0.0"
 
 
-class InterviewPackInDB(InterviewPack):
+class InterviewPackInDB(MongoIdMixin, InterviewPack):
     """Interview pack as stored in database with MongoDB ID"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
-class TechnicalQAInDB(TechnicalQA):
+class TechnicalQAInDB(MongoIdMixin, TechnicalQA):
     """Technical Q&A as stored in database with MongoDB ID"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class GenerateInterviewRequest(BaseModel):
@@ -135,6 +133,9 @@ class GenerateInterviewRequest(BaseModel):
 
 class InterviewPackResponse(BaseModel):
     """Response for interview pack retrieval"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     interview_pack: InterviewPackInDB
     technical_qa: TechnicalQAInDB
     message: str = "Interview materials retrieved successfully"
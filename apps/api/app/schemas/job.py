@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, ConfigDict, computed_field
 from typing import Optional
 from datetime import datetime
+from functools import cached_property
 import hashlib
+from .base import MongoIdMixin
 
 
 class JobPosting(BaseModel):
@@ -30,46 +32,46 @@ class JobPosting(BaseModel):
     source_compliance_note: Optional[str] = None  # Legal compliance note
     fetched_at: datetime = Field(default_factory=datetime.utcnow)
     
-    # Deduplication
-    dedupe_hash: str = ""  # sha256 hash for deduplication
-    
     # Persistence tracking
     first_seen: datetime = Field(default_factory=datetime.utcnow)
     last_seen: datetime = Field(default_factory=datetime.utcnow)
     
-    def model_post_init(self, __context) -> None:
-        """Generate dedupe_hash after initialization if not set"""
-        if not self.dedupe_hash:
-            self.dedupe_hash = self.generate_hash()
+    # Deduplication: computed on first access and included in dumps, so
+    # instances whose hash is never read skip the sha256 entirely
+    @computed_field
+    @cached_property
+    def dedupe_hash(self) -> str:
+        """SHA256 hash for deduplication"""
+        return self.generate_hash()
     
     def generate_hash(self) -> str:
         """Generate SHA256 hash for deduplication based on normalized fields"""
-        # Normalize fields for consistent hashing
-        normalized_company = self.company.lower().strip()
-        normalized_title = self.title.lower().strip()
-        normalized_url = self.url.lower().strip()
-        
-        # Create hash from stable fields
-        hash_string = f"{normalized_company}|{normalized_title}|{normalized_url}"
+        # Normalize and join stable fields into one buffer; lowercasing the
+        # joined string once is equivalent to lowercasing each field
+        hash_string = "|".join(
+            (self.company.strip(), self.title.strip(), self.url.strip())
+        ).lower()
         return hashlib.sha256(hash_string.encode()).hexdigest()
 
 
-class JobPostingInDB(JobPosting):
+class JobPostingInDB(MongoIdMixin, JobPosting):
     """Job posting as stored in database with MongoDB ID"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class JobPostingResponse(BaseModel):
     """Response for single job posting"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     job: JobPostingInDB
     message: str = "Job retrieved successfully"
 
 
 class JobListResponse(BaseModel):
     """Response for job listing with pagination"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     jobs: list[JobPostingInDB]
     total: int
     page: int = 1
@@ -79,6 +81,9 @@ class JobListResponse(BaseModel):
 
 class IngestResponse(BaseModel):
     """Response from job ingestion"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     jobs_fetched: int
     jobs_new: int
     jobs_updated: int
@@ -2,32 +2,36 @@
 Job queue schemas for background job execution
 """
 from datetime import datetime
-from typing import Optional, Dict, Any
-from enum import Enum
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, Literal
+from pydantic import BaseModel, Field, ConfigDict
+from .base import MongoIdMixin
 
 
-class JobType(str, Enum):
-    """Types of background jobs"""
-    JOB_INGESTION = "job_ingestion"
-    MATCH_RECOMPUTE = "match_recompute"
-    PACKET_GENERATION = "packet_generation"
-    INTERVIEW_GENERATION = "interview_generation"
+# Types of background jobs
+JobType = Literal[
+    "job_ingestion",
+    "match_recompute",
+    "packet_generation",
+    "interview_generation",
+]
+JOB_INGESTION: JobType = "job_ingestion"
+MATCH_RECOMPUTE: JobType = "match_recompute"
+PACKET_GENERATION: JobType = "packet_generation"
+INTERVIEW_GENERATION: JobType = "interview_generation"
 
-
-class JobStatus(str, Enum):
-    """Status of background jobs"""
-    QUEUED = "queued"
-    RUNNING = "running"
-    SUCCEEDED = "succeeded"
-    FAILED = "failed"
+# Status of background jobs
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+QUEUED: JobStatus = "queued"
+RUNNING: JobStatus = "running"
+SUCCEEDED: JobStatus = "succeeded"
+FAILED: JobStatus = "failed"
 
 
 class BackgroundJob(BaseModel):
     """Background job model"""
     user_id: Optional[str] = Field(None, description="User ID (for multi-user systems)")
     type: JobType = Field(..., description="Job type")
-    status: JobStatus = Field(default=JobStatus.QUEUED, description="Job status")
+    status: JobStatus = Field(default=QUEUED, description="Job status")
     progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
     message: Optional[str] = Field(None, description="Progress or status message")
     error: Optional[str] = Field(None, description="Error message if failed")
@@ -51,12 +55,9 @@ class BackgroundJob(BaseModel):
     result: Optional[Dict[str, Any]] = Field(None, description="Job result data")
 
 
-class BackgroundJobInDB(BackgroundJob):
+class BackgroundJobInDB(MongoIdMixin, BackgroundJob):
     """Background job as stored in database"""
-    id: str = Field(..., alias="_id")
-    
-    class Config:
-        populate_by_name = True
+    id: str = Field(..., serialization_alias="_id")
 
 
 class JobCreateRequest(BaseModel):
@@ -68,6 +69,9 @@ class JobCreateRequest(BaseModel):
 
 class JobResponse(BaseModel):
     """Response for job creation"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     job_id: str
     type: JobType
     status: JobStatus
@@ -76,6 +80,9 @@ class JobResponse(BaseModel):
 
 class JobListResponse(BaseModel):
     """Response for listing jobs"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     jobs: list[BackgroundJobInDB]
     total: int
     page: int
@@ -1,7 +1,8 @@
 """Match schemas for job matching results"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Dict, List
 from datetime import datetime
+from .base import MongoIdMixin
 
 
 class ScoreBreakdown(BaseModel):
@@ -25,7 +26,7 @@ class Match(BaseModel):
     score_breakdown: ScoreBreakdown
     
     # Explainability
-    top_reasons: List[str] = Field(default_factory=list, max_length=5)
+    top_reasons: tuple[str, ...] = ()  # At most 5, capped by generate_explainability
     gaps: List[str] = Field(default_factory=list)  # Missing skills/evidence
     recommendations: List[str] = Field(default_factory=list)  # Actionable advice
     
@@ -37,12 +38,8 @@ class Match(BaseModel):
     posted_date: Optional[datetime] = None
 
 
-class MatchInDB(Match):
+class MatchInDB(MongoIdMixin, Match):
     """Match as stored in database with MongoDB ID"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class MatchWithJob(BaseModel):
@@ -53,6 +50,9 @@ class MatchWithJob(BaseModel):
 
 class MatchResponse(BaseModel):
     """Response for single match"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     match: MatchInDB
     job: Optional[Dict] = None
     message: str = "Match retrieved successfully"
@@ -60,6 +60,9 @@ class MatchResponse(BaseModel):
 
 class MatchListResponse(BaseModel):
     """Response for match listing"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     matches: List[MatchWithJob]
     total: int
     page: int = 1
@@ -69,6 +72,9 @@ class MatchListResponse(BaseModel):
 
 class RecomputeMatchesResponse(BaseModel):
     """Response from match recomputation"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     matches_computed: int
     profile_id: str
     jobs_processed: int
@@ -1,10 +1,13 @@
 """Packet schemas for tailored CV generation and application materials"""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Dict
 from datetime import datetime
+from .base import MongoIdMixin
 
 
-class BulletSwap(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BulletSwap:
     """Suggested bullet point swap for experience role"""
     role_index: int  # Index in experience list
     original_bullet: str
@@ -37,7 +40,8 @@ class TailoringPlan(BaseModel):
     model_version: str = "1.0.0"
 
 
-class PacketFile(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PacketFile:
     """File information for a packet asset"""
     filename: str
     filepath: str  # Relative to PACKETS_DIR
@@ -73,12 +77,8 @@ class Packet(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
-class PacketInDB(Packet):
+class PacketInDB(MongoIdMixin, Packet):
     """Packet as stored in database with MongoDB ID"""
-    id: Optional[str] = Field(alias="_id", default=None)
-    
-    class Config:
-        populate_by_name = True
 
 
 class GeneratePacketRequest(BaseModel):
@@ -90,12 +90,18 @@ class GeneratePacketRequest(BaseModel):
 
 class PacketResponse(BaseModel):
     """Response for single packet"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     packet: PacketInDB
     message: str = "Packet generated successfully"
 
 
 class PacketListResponse(BaseModel):
     """Response for packet listing"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     packets: List[PacketInDB]
     total: int
     page: int = 1
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, ConfigDict
+from pydantic.dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
+from .base import Email
 
 
 class Preferences(BaseModel):
@@ -15,7 +17,8 @@ class Preferences(BaseModel):
     languages: list[str] = Field(default_factory=list)
 
 
-class ExperienceBullet(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ExperienceBullet:
     """Experience bullet point with evidence reference"""
     text: str
     evidence_ref: Optional[str] = None  # e.g., "page 1", "section 2, para 3"
@@ -57,7 +60,7 @@ class UserProfile(BaseModel):
     """Complete user profile schema"""
     # Basic info
     name: str
-    email: EmailStr
+    email: Email
     links: list[str] = Field(default_factory=list)  # LinkedIn, GitHub, portfolio, etc.
     summary: Optional[str] = None
     
@@ -84,7 +87,7 @@ class UserProfile(BaseModel):
 class UserProfileUpdate(BaseModel):
     """Schema for partial profile updates"""
     name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     links: Optional[list[str]] = None
     summary: Optional[str] = None
     skills: Optional[list[SkillGroup]] = None
@@ -96,6 +99,9 @@ class UserProfileUpdate(BaseModel):
 
 class UploadCVResponse(BaseModel):
     """Response from CV upload endpoint"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     extracted_text: str
     draft_profile: UserProfile
     message: str = "CV processed successfully"
@@ -103,11 +109,17 @@ class UploadCVResponse(BaseModel):
 
 class ProfileResponse(BaseModel):
     """Response from profile retrieval"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     profile: UserProfile
     message: str = "Profile retrieved successfully"
 
 
 class ProfileSaveResponse(BaseModel):
     """Response from profile save operation"""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     profile_id: str
     message: str = "Profile saved successfully"
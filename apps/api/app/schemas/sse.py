@@ -2,22 +2,36 @@
 Server-Sent Events (SSE) schemas for real-time updates
 """
 from datetime import datetime
-from typing import Optional, Dict, Any
-from enum import Enum
+from typing import Optional, Dict, Any, Literal, TypedDict
 from pydantic import BaseModel, Field
+from .base import MongoIdMixin
 
 
-class EventType(str, Enum):
-    """Types of SSE events"""
-    JOB_CREATED = "job.created"
-    JOB_PROGRESS = "job.progress"
-    JOB_COMPLETED = "job.completed"
-    JOB_FAILED = "job.failed"
-    APPLICATION_STATUS_CHANGE = "application.status_change"
+# Types of SSE events
+EventType = Literal[
+    "job.created",
+    "job.progress",
+    "job.completed",
+    "job.failed",
+    "application.status_change",
+]
+JOB_CREATED: EventType = "job.created"
+JOB_PROGRESS: EventType = "job.progress"
+JOB_COMPLETED: EventType = "job.completed"
+JOB_FAILED: EventType = "job.failed"
+APPLICATION_STATUS_CHANGE: EventType = "application.status_change"
+
+
+class SSEEventDict(TypedDict, total=False):
+    """Wire format for internally produced events, emitted without validation"""
+    type: EventType
+    data: Dict[str, Any]
+    timestamp: datetime
+    user_id: Optional[str]
 
 
 class SSEEvent(BaseModel):
-    """Server-Sent Event model"""
+    """Server-Sent Event model, used to validate events from external producers"""
     event_type: EventType = Field(..., description="Event type", alias="type")
     data: Dict[str, Any] = Field(..., description="Event data")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
@@ -27,9 +41,6 @@ class SSEEvent(BaseModel):
         populate_by_name = True
 
 
-class SSEEventInDB(SSEEvent):
+class SSEEventInDB(MongoIdMixin, SSEEvent):
     """SSE Event as stored in database"""
-    id: str = Field(..., alias="_id")
-    
-    class Config:
-        populate_by_name = True
+    id: str = Field(..., serialization_alias="_id")
@@ -1,7 +1,8 @@
 import fitz  # PyMuPDF
 from docx import Document
 import re
-from typing import Tuple
+from itertools import islice
+from typing import Optional, Tuple
 from app.schemas import (
     UserProfile,
     ExperienceRole,
@@ -13,76 +14,137 @@ from app.schemas import (
 )
 
 
+# Patterns are compiled once at import instead of on every extraction call
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+_URL_RE = re.compile(r'https?://[^\s]+')
+_YEAR_RE = re.compile(r'\d{4}')
+# Non-empty lines (from their first non-space character), found lazily
+_LINE_RE = re.compile(r'\S.*')
+_NAME_EXCLUDE_RE = re.compile(r'cv|resume|curriculum|vitae|page', re.IGNORECASE)
+
+# Skill keywords by category, matched against whole tokens of the CV text
+_SKILL_CATEGORIES = {
+    "Programming Languages": frozenset({
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
+        'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'
+    }),
+    "Frameworks": frozenset({
+        'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
+        'express', 'nextjs', 'next.js', 'node.js', 'nodejs', '.net', 'rails'
+    }),
+    "Tools & Technologies": frozenset({
+        'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins',
+        'terraform', 'ansible', 'mongodb', 'postgresql', 'mysql', 'redis'
+    }),
+}
+# Keeps '+', '#' and '.' inside tokens so "c++", "c#" and "node.js" survive
+_TOKEN_RE = re.compile(r'[A-Za-z0-9+.#]+')
+
+# Section headers, located with str.find rather than a lazy `.*?` regex
+_EXP_HEADERS = ('experience', 'employment', 'work history')
+_EXP_END_HEADERS = ('education', 'projects', 'skills')
+_EDU_HEADERS = ('education', 'academic')
+_EDU_END_HEADERS = ('experience', 'skills', 'projects')
+
+
+def _evidence_key(line: str) -> str:
+    """Canonical prefix used to pair a bullet with its evidence snippet"""
+    return line.lstrip('-•* ').strip()[:50].lower()
+
+
+def _find_section(text: str, headers: tuple, end_headers: tuple) -> Optional[str]:
+    """Slice the lowercased text between the first section header and the next end header
+    
+    The section is returned lowercased, as the original search over
+    text.lower() did; the capitalized-line heuristics that read it must
+    not build roles with placeholder company and dates from it.
+    
+    Returns:
+        Lowercased section body, or None if no header is present
+    """
+    text_lower = text.lower()
+    starts = [(i, h) for h in headers if (i := text_lower.find(h)) != -1]
+    if not starts:
+        return None
+    start, header = min(starts)
+    body_start = start + len(header)
+    end = min(
+        (i for h in end_headers if (i := text_lower.find(h, body_start)) != -1),
+        default=len(text_lower),
+    )
+    return text_lower[body_start:end]
+
+
 class CVExtractor:
     """Extract and parse CV content from PDF and DOCX files"""
     
     @staticmethod
-    def extract_text_from_pdf(file_content: bytes) -> Tuple[str, dict]:
+    def extract_text_from_pdf(file_content: bytes) -> Tuple[str, list[tuple[str, str]]]:
         """Extract text from PDF with page references
         
         Returns:
-            Tuple of (full_text, evidence_map)
-            evidence_map: dict mapping text snippets to page numbers
+            Tuple of (full_text, evidence)
+            evidence: list of (text snippet, page number) pairs
         """
         doc = fitz.open(stream=file_content, filetype="pdf")
-        full_text = ""
-        evidence_map = {}
+        parts = []
+        evidence = []
         
         for page_num, page in enumerate(doc, start=1):
             page_text = page.get_text()
-            full_text += f"\n--- Page {page_num} ---\n{page_text}"
+            parts.append(f"\n--- Page {page_num} ---\n{page_text}")
             
             # Store page reference for paragraphs
             paragraphs = [p.strip() for p in page_text.split('\n') if p.strip()]
             for para in paragraphs:
                 if len(para) > 20:  # Only store substantial paragraphs
-                    evidence_map[para[:100]] = f"page {page_num}"
+                    evidence.append((para[:100], f"page {page_num}"))
         
         doc.close()
-        return full_text, evidence_map
+        return "".join(parts), evidence
     
     @staticmethod
-    def extract_text_from_docx(file_content: bytes) -> Tuple[str, dict]:
+    def extract_text_from_docx(file_content: bytes) -> Tuple[str, list[tuple[str, str]]]:
         """Extract text from DOCX with paragraph references
         
         Returns:
-            Tuple of (full_text, evidence_map)
-            evidence_map: dict mapping text snippets to paragraph indices
+            Tuple of (full_text, evidence)
+            evidence: list of (text snippet, paragraph index) pairs
         """
         import io
         doc = Document(io.BytesIO(file_content))
-        full_text = ""
-        evidence_map = {}
+        parts = []
+        evidence = []
         
         for para_idx, paragraph in enumerate(doc.paragraphs, start=1):
             text = paragraph.text.strip()
             if text:
-                full_text += text + "\n"
+                parts.append(text + "\n")
                 if len(text) > 20:  # Only store substantial paragraphs
-                    evidence_map[text[:100]] = f"paragraph {para_idx}"
+                    evidence.append((text[:100], f"paragraph {para_idx}"))
         
-        return full_text, evidence_map
+        return "".join(parts), evidence
     
     @staticmethod
     def extract_email(text: str) -> str:
         """Extract email from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
+        matches = _EMAIL_RE.findall(text)
         return matches[0] if matches else "user@example.com"
     
     @staticmethod
     def extract_name(text: str) -> str:
         """Extract name from text (typically first few lines)"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        # Only the first few non-empty lines are read, not the whole CV
+        lines = (match.group().rstrip() for match in _LINE_RE.finditer(text))
         # Usually name is in first few lines, exclude common headers
-        for line in lines[:5]:
+        for line in islice(lines, 5):
+            words = line.split()
             # Skip lines with keywords like CV, Resume, etc.
-            if len(line.split()) <= 4 and not any(
-                kw in line.lower() for kw in ['cv', 'resume', 'curriculum', 'vitae', 'page']
-            ):
+            if 2 <= len(words) <= 4 and not _NAME_EXCLUDE_RE.search(line):
                 # Check if line looks like a name (capitalized words)
-                words = line.split()
-                if 2 <= len(words) <= 4 and all(w[0].isupper() for w in words if w):
+                if all(w[0].isupper() for w in words):
                     return line
         return "Unknown Name"
     
@@ -90,91 +152,63 @@ class CVExtractor:
     def extract_links(text: str) -> list[str]:
         """Extract URLs and social links from text"""
         links = []
-        # LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        links.extend(re.findall(linkedin_pattern, text.lower()))
+        # LinkedIn (matched case-insensitively; only the hits are lowercased)
+        links.extend(link.lower() for link in _LINKEDIN_RE.findall(text))
         
         # GitHub
-        github_pattern = r'github\.com/[\w-]+'
-        links.extend(re.findall(github_pattern, text.lower()))
+        links.extend(link.lower() for link in _GITHUB_RE.findall(text))
         
         # General URLs
-        url_pattern = r'https?://[^\s]+'
-        links.extend(re.findall(url_pattern, text))
+        links.extend(_URL_RE.findall(text))
         
         return list(set(links))[:5]  # Limit to 5 unique links
     
     @staticmethod
     def extract_skills(text: str) -> list[SkillGroup]:
         """Extract skills from text and group them"""
-        # Common skill categories and their keywords
-        programming_langs = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby',
-            'go', 'rust', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab'
-        }
-        frameworks = {
-            'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
-            'express', 'nextjs', 'next.js', 'node.js', 'nodejs', '.net', 'rails'
-        }
-        tools = {
-            'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins',
-            'terraform', 'ansible', 'mongodb', 'postgresql', 'mysql', 'redis'
-        }
-        
-        text_lower = text.lower()
+        # One tokenization pass; sentence-final periods are stripped so
+        # "Python." still matches while ".net" keeps its leading dot
+        tokens = {token.lower().rstrip('.') for token in _TOKEN_RE.findall(text)}
         
         # Extract skills by category
-        found_langs = [skill for skill in programming_langs if skill in text_lower]
-        found_frameworks = [skill for skill in frameworks if skill in text_lower]
-        found_tools = [skill for skill in tools if skill in text_lower]
-        
         skill_groups = []
-        if found_langs:
-            skill_groups.append(SkillGroup(
-                category="Programming Languages",
-                skills=[s.title() for s in found_langs]
-            ))
-        if found_frameworks:
-            skill_groups.append(SkillGroup(
-                category="Frameworks",
-                skills=[s.title() for s in found_frameworks]
-            ))
-        if found_tools:
-            skill_groups.append(SkillGroup(
-                category="Tools & Technologies",
-                skills=[s.title() for s in found_tools]
-            ))
+        for category, keywords in _SKILL_CATEGORIES.items():
+            found = keywords & tokens
+            if found:
+                skill_groups.append(SkillGroup(
+                    category=category,
+                    skills=[s.title() for s in sorted(found)]
+                ))
         
         return skill_groups
     
     @staticmethod
-    def extract_experience(text: str, evidence_map: dict) -> list[ExperienceRole]:
+    def extract_experience(text: str, evidence: list[tuple[str, str]]) -> list[ExperienceRole]:
         """Extract work experience from text"""
         experiences = []
         
         # Look for common experience section headers
-        exp_section_match = re.search(
-            r'(experience|employment|work history)(.*?)(education|projects|skills|$)',
-            text.lower(),
-            re.DOTALL
-        )
+        exp_text = _find_section(text, _EXP_HEADERS, _EXP_END_HEADERS)
         
-        if not exp_section_match:
+        if exp_text is None:
             # Try to extract any company/role patterns
             return []
         
-        exp_text = exp_section_match.group(2)
-        
         # Simple pattern: look for company names (capitalized) followed by role
         # This is a basic heuristic
         lines = [line.strip() for line in exp_text.split('\n') if line.strip()]
         
+        # Index evidence by bullet prefix once; the first snippet for a key wins
+        evidence_refs = {}
+        for snippet, ref in evidence:
+            evidence_refs.setdefault(_evidence_key(snippet), ref)
+        
         current_role = None
         for i, line in enumerate(lines):
             # Check if line looks like a company/title (has capitalized words)
             if len(line) > 3 and line[0].isupper():
                 # Check if it might be a date range
-                if re.search(r'\d{4}', line):
+                if _YEAR_RE.search(line):
                     if current_role and 'dates' not in current_role:
                         current_role['dates'] = line
                 # Check if it looks like a company or title
@@ -193,12 +227,7 @@ class CVExtractor:
             # Check if line is a bullet point
             elif line.startswith(('-', '•', '*')) and current_role:
                 bullet_text = line.lstrip('-•* ').strip()
-                evidence_ref = None
-                # Try to find evidence reference
-                for snippet, ref in evidence_map.items():
-                    if bullet_text[:50] in snippet:
-                        evidence_ref = ref
-                        break
+                evidence_ref = evidence_refs.get(_evidence_key(bullet_text))
                 
                 current_role['bullets'].append(
                     ExperienceBullet(text=bullet_text, evidence_ref=evidence_ref)
@@ -216,16 +245,10 @@ class CVExtractor:
         education = []
         
         # Look for education section
-        edu_section_match = re.search(
-            r'(education|academic)(.*?)(experience|skills|projects|$)',
-            text.lower(),
-            re.DOTALL
-        )
+        edu_text = _find_section(text, _EDU_HEADERS, _EDU_END_HEADERS)
         
-        if not edu_section_match:
+        if edu_text is None:
             return []
-        
-        edu_text = edu_section_match.group(2)
         lines = [line.strip() for line in edu_text.split('\n') if line.strip()]
         
         current_edu = None
@@ -241,7 +264,7 @@ class CVExtractor:
                     'dates': None,
                     'details': []
                 }
-            elif current_edu and re.search(r'\d{4}', line):
+            elif current_edu and _YEAR_RE.search(line):
                 current_edu['dates'] = line
         
         if current_edu:
@@ -250,12 +273,12 @@ class CVExtractor:
         return education
     
     @classmethod
-    def create_draft_profile(cls, text: str, evidence_map: dict) -> UserProfile:
+    def create_draft_profile(cls, text: str, evidence: list[tuple[str, str]]) -> UserProfile:
         """Create a draft UserProfile from extracted text
         
         Args:
             text: Extracted text from CV
-            evidence_map: Mapping of text snippets to their source references
+            evidence: (text snippet, source reference) pairs
             
         Returns:
             UserProfile with populated fields (no hallucination - unknown fields left empty)
@@ -266,7 +289,7 @@ class CVExtractor:
             links=cls.extract_links(text),
             summary=None,  # Don't hallucinate summary
             skills=cls.extract_skills(text),
-            experience=cls.extract_experience(text, evidence_map),
+            experience=cls.extract_experience(text, evidence),
             projects=[],  # TODO: Could add project extraction
             education=cls.extract_education(text),
             preferences=Preferences(),  # Empty preferences - user must fill
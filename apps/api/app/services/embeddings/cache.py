@@ -1,9 +1,36 @@
 """Embedding cache service for storing and retrieving embeddings"""
 import hashlib
-from typing import Optional, List
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, List
 from datetime import datetime
+import numpy as np
+from bson import Binary
+from pymongo import UpdateOne
 from app.models.database import Database
 
+# Stored vector precision; float16 is 4x smaller than a BSON array of
+# doubles and loses nothing that matters for cosine similarity
+_STORAGE_DTYPE = np.float16
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(text: str, model: str) -> str:
+    """Hash text + model into a cache key, memoized for repeated texts"""
+    hash_input = f"{model}:{text}"
+    return hashlib.sha256(hash_input.encode()).hexdigest()
+
+
+def pack_embedding(embedding: List[float]) -> Binary:
+    """Encode an embedding as packed float16 bytes for storage"""
+    return Binary(np.asarray(embedding, dtype=_STORAGE_DTYPE).tobytes())
+
+
+def unpack_embedding(stored) -> np.ndarray:
+    """Decode a stored embedding; documents written before packing hold a plain list"""
+    if isinstance(stored, bytes):
+        return np.frombuffer(stored, dtype=_STORAGE_DTYPE).astype(np.float32)
+    return np.asarray(stored, dtype=np.float32)
+
 
 class EmbeddingCache:
     """Cache for storing and retrieving embeddings in MongoDB"""
@@ -14,11 +41,11 @@ class EmbeddingCache:
     @staticmethod
     def _generate_cache_key(text: str, model: str) -> str:
         """Generate cache key from text and model"""
-        # Create hash from text + model to use as cache key
-        hash_input = f"{model}:{text}"
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        # The profile text is rebuilt and looked up for every job during
+        # match recompute, so repeated texts skip the encode and sha256
+        return _cache_key(text, model)
     
-    async def get(self, text: str, model: str) -> Optional[List[float]]:
+    async def get(self, text: str, model: str) -> Optional[np.ndarray]:
         """
         Get embedding from cache
         
@@ -30,10 +57,13 @@ class EmbeddingCache:
             Embedding vector if found, None otherwise
         """
         cache_key = self._generate_cache_key(text, model)
-        doc = await self.collection.find_one({"cache_key": cache_key})
+        doc = await self.collection.find_one(
+            {"cache_key": cache_key},
+            projection={"embedding": 1, "_id": 0},
+        )
         
-        if doc:
-            return doc.get("embedding")
+        if doc and doc.get("embedding") is not None:
+            return unpack_embedding(doc["embedding"])
         return None
     
     async def set(self, text: str, model: str, embedding: List[float]) -> None:
@@ -51,7 +81,7 @@ class EmbeddingCache:
             "cache_key": cache_key,
             "text": text,
             "model": model,
-            "embedding": embedding,
+            "embedding": pack_embedding(embedding),
             "created_at": datetime.utcnow(),
         }
         
@@ -62,7 +92,7 @@ class EmbeddingCache:
             upsert=True
         )
     
-    async def get_batch(self, texts: List[str], model: str) -> dict[str, Optional[List[float]]]:
+    async def get_batch(self, texts: List[str], model: str) -> dict[str, Optional[np.ndarray]]:
         """
         Get multiple embeddings from cache
         
@@ -75,14 +105,18 @@ class EmbeddingCache:
         """
         cache_keys = {self._generate_cache_key(text, model): text for text in texts}
         
-        cursor = self.collection.find({"cache_key": {"$in": list(cache_keys.keys())}})
+        # Only the key and vector are needed, not the stored source text
+        cursor = self.collection.find(
+            {"cache_key": {"$in": list(cache_keys.keys())}},
+            projection={"cache_key": 1, "embedding": 1, "_id": 0},
+        )
         docs = await cursor.to_list(length=None)
         
         # Map cache keys back to original texts
         result = {text: None for text in texts}
         for doc in docs:
             original_text = cache_keys[doc["cache_key"]]
-            result[original_text] = doc["embedding"]
+            result[original_text] = unpack_embedding(doc["embedding"])
         
         return result
     
@@ -98,21 +132,56 @@ class EmbeddingCache:
         if len(texts) != len(embeddings):
             raise ValueError("Number of texts and embeddings must match")
         
-        docs = []
+        created_at = datetime.utcnow()
+        ops = []
         for text, embedding in zip(texts, embeddings):
             cache_key = self._generate_cache_key(text, model)
-            docs.append({
+            doc = {
                 "cache_key": cache_key,
                 "text": text,
                 "model": model,
-                "embedding": embedding,
-                "created_at": datetime.utcnow(),
-            })
+                "embedding": pack_embedding(embedding),
+                "created_at": created_at,
+            }
+            ops.append(UpdateOne({"cache_key": cache_key}, {"$set": doc}, upsert=True))
         
-        # Bulk upsert
-        for doc in docs:
-            await self.collection.update_one(
-                {"cache_key": doc["cache_key"]},
-                {"$set": doc},
-                upsert=True
+        # Bulk upsert in a single round trip
+        if ops:
+            await self.collection.bulk_write(ops, ordered=False)
+    
+    async def get_or_compute_batch(
+        self,
+        texts: List[str],
+        model: str,
+        compute_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[np.ndarray]:
+        """
+        Get embeddings for texts, computing and caching only the misses
+        
+        Duplicate texts are looked up, computed and stored once.
+        
+        Args:
+            texts: List of texts (may contain duplicates)
+            model: Model name
+            compute_fn: Async batch embedder called with the uncached texts,
+                e.g. EmbeddingProvider.get_embeddings
+            
+        Returns:
+            float32 embedding vectors in the same order as texts
+        """
+        unique = list(dict.fromkeys(texts))
+        if not unique:
+            return []
+        
+        cached = await self.get_batch(unique, model)
+        misses = [text for text in unique if cached[text] is None]
+        
+        if misses:
+            embeddings = await compute_fn(misses)
+            await self.set_batch(misses, model, embeddings)
+            cached.update(
+                (text, np.asarray(embedding, dtype=np.float32))
+                for text, embedding in zip(misses, embeddings)
             )
+        
+        return [cached[text] for text in texts]
@@ -1,9 +1,16 @@
 """OpenAI embedding provider implementation"""
+import asyncio
 import os
 from typing import List
-from openai import AsyncOpenAI
+import tiktoken
+from app.services.openai_client import get_openai_client
 from .base import EmbeddingProvider
 
+# Inputs per embeddings request; the API rejects more than 2048
+BATCH_SIZE = 512
+# Token limit per input for the OpenAI embedding models
+MAX_INPUT_TOKENS = 8191
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI embedding provider using text-embedding-3-small model"""
@@ -21,7 +28,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             raise ValueError("OpenAI API key must be provided or set in OPENAI_API_KEY env var")
         
         self.model = model
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+        
+        # Tokenizer for truncation, loaded on the first over-long input
+        self._encoding = None
         
         # Model dimensions - text-embedding-3-small has 1536 dimensions
         self._dimensions = {
@@ -30,12 +40,31 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "text-embedding-ada-002": 1536,
         }
     
+    def _truncate(self, text: str) -> str:
+        """Truncate text to the model's input token limit"""
+        # Byte-level BPE never yields more tokens than UTF-8 bytes, so short
+        # texts (almost all of them) skip tokenization entirely
+        if len(text) * 4 <= MAX_INPUT_TOKENS:
+            return text
+        
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        
+        tokens = self._encoding.encode(text)
+        if len(tokens) <= MAX_INPUT_TOKENS:
+            return text
+        return self._encoding.decode(tokens[:MAX_INPUT_TOKENS])
+    
     async def get_embedding(self, text: str) -> List[float]:
         """Get embedding vector for a single text"""
         # Clean and truncate text if needed (OpenAI has token limits)
         text = text.strip()
         if not text:
             raise ValueError("Text cannot be empty")
+        text = self._truncate(text)
         
         response = await self.client.embeddings.create(
             input=text,
@@ -48,17 +77,27 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         """Get embedding vectors for multiple texts"""
         # Clean texts
         texts = [t.strip() for t in texts]
+        if not texts:
+            return []
         if not all(texts):
             raise ValueError("All texts must be non-empty")
+        texts = [self._truncate(t) for t in texts]
         
-        response = await self.client.embeddings.create(
-            input=texts,
-            model=self.model
-        )
+        # Split into request-sized chunks and send them concurrently
+        responses = await asyncio.gather(*(
+            self.client.embeddings.create(
+                input=texts[i:i + BATCH_SIZE],
+                model=self.model
+            )
+            for i in range(0, len(texts), BATCH_SIZE)
+        ))
         
-        # Sort by index to ensure order matches input
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        return [item.embedding for item in sorted_data]
+        # gather keeps chunk order; sort by index within each chunk
+        return [
+            item.embedding
+            for response in responses
+            for item in sorted(response.data, key=lambda x: x.index)
+        ]
     
     def get_model_name(self) -> str:
         """Get the model name"""
@@ -1,6 +1,10 @@
 """Interview preparation service using LLM for structured generation"""
+import asyncio
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Optional, Tuple
+from pydantic import BaseModel
 from app.schemas.interview import (
     InterviewPack,
     TechnicalQA,
@@ -17,6 +21,128 @@ from app.schemas.job import JobPosting
 from app.schemas.packet import Packet
 from app.services.llm import get_llm_provider
 
+# Maximum concurrent per-topic LLM requests when generating technical Q&A
+QA_TOPIC_CONCURRENCY = 5
+
+# Job description scanning: non-empty lines (from their first non-space
+# character), role keywords, and whole lines mentioning the company
+_LINE_RE = re.compile(r'\S.*')
+_ROLE_KEYWORDS_RE = re.compile(r'responsible|will|role|position|duties', re.IGNORECASE)
+_COMPANY_LINE_RE = re.compile(
+    r'^.*(?:company|we are|about us|our mission|founded).*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Technical topics to look for in job descriptions; the group name is the
+# topic (underscore for space), in the order topics are added
+_TOPIC_KEYWORDS_RE = re.compile(
+    r'(?P<algorithms>algorithm|data structure|complexity)'
+    r'|(?P<system_design>system design|architecture|scalability|distributed)'
+    r'|(?P<python>python)'
+    r'|(?P<sql>sql|database|query)'
+    r'|(?P<api_design>api|rest|graphql)'
+    r'|(?P<testing>unit test|test|tdd)'
+    r'|(?P<cloud>aws|azure|gcp|cloud)',
+    re.IGNORECASE,
+)
+_TOPIC_TITLES = {
+    name: name.replace('_', ' ').title() for name in _TOPIC_KEYWORDS_RE.groupindex
+}
+
+# Gaps that warrant coding practice in the study checklist
+_PRACTICE_KEYWORDS_RE = re.compile(r'python|java|sql|algorithm|data structure', re.IGNORECASE)
+
+# System prompts for each generation step
+_PLAN_SYSTEM_PROMPT = "You are an expert career coach helping candidates prepare for new roles. Always output in English."
+_STAR_SYSTEM_PROMPT = "You are an interview coach who helps candidates structure their real experience into compelling STAR stories. Never fabricate details. Always output in English."
+_QUESTIONS_SYSTEM_PROMPT = "You are an interview coach helping candidates prepare thoughtful questions. Always output in English."
+_TOPIC_SYSTEM_PROMPT = "You are a technical interviewer creating high-quality interview questions with detailed answers. Always output in English."
+
+
+@lru_cache(maxsize=256)
+def _build_experience_context(bullets: tuple) -> Tuple[Tuple[dict, ...], str]:
+    """
+    Build the STAR grounding context and its prompt text from experience bullets
+    
+    Cached on the bullets themselves, so the same profile applying to many
+    jobs formats its experience once. The returned dicts are shared between
+    calls and must not be mutated.
+    
+    Args:
+        bullets: Tuples of (role_index, bullet_index, company, title, text, evidence_ref)
+        
+    Returns:
+        Tuple of (experience_context, experience_text)
+    """
+    experience_context = tuple(
+        {
+            "role_index": role_idx,
+            "bullet_index": bullet_idx,
+            "company": company,
+            "title": title,
+            "text": text,
+            "evidence": evidence
+        }
+        for role_idx, bullet_idx, company, title, text, evidence in bullets
+    )
+    
+    # Format experience for prompt
+    experience_text = "\n".join([
+        f"Experience {i}: [{exp['company']} - {exp['title']}] {exp['text']}"
+        for i, exp in enumerate(experience_context)
+    ])
+    
+    return experience_context, experience_text
+
+
+# LLM response schemas, defined once at import rather than per request
+
+class Plan306090(BaseModel):
+    plan_30_days: List[str]
+    plan_60_days: List[str]
+    plan_90_days: List[str]
+
+
+class GroundingRef(BaseModel):
+    experience_index: int
+    evidence_text: str
+
+
+class STARStoryModel(BaseModel):
+    title: str
+    situation: str
+    task: str
+    action: str
+    result: str
+    skills_demonstrated: List[str]
+    grounding_refs: List[GroundingRef]
+
+
+class STARStoriesResponse(BaseModel):
+    stories: List[STARStoryModel]
+
+
+class QuestionModel(BaseModel):
+    question: str
+    category: str
+    reasoning: str
+
+
+class QuestionsResponse(BaseModel):
+    questions: List[QuestionModel]
+
+
+class TopicQuestionModel(BaseModel):
+    question: str
+    difficulty: DifficultyLevel
+    answer: str
+    follow_ups: List[str]
+    key_concepts: List[str]
+
+
+class TopicQuestionsResponse(BaseModel):
+    questions: List[TopicQuestionModel]
+
 
 class InterviewPrepService:
     """Service for generating interview preparation materials"""
@@ -47,14 +173,15 @@ class InterviewPrepService:
         role_digest = self._extract_role_digest(job)
         company_digest, integrity_note = self._extract_company_digest(job)
         
-        # Generate 30/60/90 day plan
-        plans = await self._generate_30_60_90_plan(profile, job)
-        
-        # Generate STAR stories grounded in experience
-        star_stories = await self._generate_star_stories(profile, job)
-        
-        # Generate questions to ask interviewer
-        questions = await self._generate_interview_questions(job)
+        # The three LLM generations are independent, so run them concurrently:
+        # 30/60/90 day plan, STAR stories grounded in experience, and
+        # questions to ask the interviewer. Each falls back on its own
+        # failure instead of raising.
+        plans, star_stories, questions = await asyncio.gather(
+            self._generate_30_60_90_plan(profile, job),
+            self._generate_star_stories(profile, job),
+            self._generate_interview_questions(job),
+        )
         
         # Generate study checklist (placeholders)
         study_checklist = self._generate_study_checklist(profile, job, packet)
@@ -113,11 +240,12 @@ class InterviewPrepService:
         description = job.description_clean or job.description_raw or ""
         
         # Simple extraction: take first few sentences or key responsibilities
-        lines = [line.strip() for line in description.split('\n') if line.strip()]
+        # Look at first 10 non-empty lines only
+        lines = [m.group().rstrip() for m in islice(_LINE_RE.finditer(description), 10)]
         digest_lines = []
         
-        for line in lines[:10]:  # Look at first 10 lines
-            if any(keyword in line.lower() for keyword in ['responsible', 'will', 'role', 'position', 'duties']):
+        for line in lines:
+            if _ROLE_KEYWORDS_RE.search(line):
                 digest_lines.append(line)
                 if len(digest_lines) >= 3:
                     break
@@ -137,14 +265,14 @@ class InterviewPrepService:
         """
         description = job.description_clean or job.description_raw or ""
         
-        # Look for company information in description
-        company_lines = []
-        for line in description.split('\n'):
-            if any(keyword in line.lower() for keyword in ['company', 'we are', 'about us', 'our mission', 'founded']):
-                company_lines.append(line.strip())
+        # Look for company information in description (one regex pass,
+        # stopping after the first 3 matching lines)
+        company_lines = [
+            m.group().strip() for m in islice(_COMPANY_LINE_RE.finditer(description), 3)
+        ]
         
         if company_lines:
-            digest = " ".join(company_lines[:3])
+            digest = " ".join(company_lines)
             integrity_note = None
         else:
             digest = f"Company information not provided in job description. Research {job.company} independently."
@@ -159,6 +287,10 @@ class InterviewPrepService:
     ) -> Dict[str, List[str]]:
         """Generate 30/60/90 day plan using LLM"""
         
+        # Nothing to tailor the plan to; skip the LLM round trip
+        if not profile.skills and not (job.description_clean or job.description_raw):
+            return self._fallback_plan()
+        
         prompt = f"""Generate a realistic 30/60/90 day plan for someone starting as a {job.title} at {job.company}.
 
 Profile skills: {', '.join([s for sg in profile.skills for s in sg.skills])}
@@ -169,19 +301,11 @@ Return 3-5 goals per period.
 
 IMPORTANT: Output must be in English only."""
         
-        # Define inline schema for 30/60/90 plan
-        from pydantic import BaseModel
-        
-        class Plan306090(BaseModel):
-            plan_30_days: List[str]
-            plan_60_days: List[str]
-            plan_90_days: List[str]
-        
         try:
             plan = await self.llm_provider.generate_structured(
                 prompt=prompt,
                 response_model=Plan306090,
-                system_prompt="You are an expert career coach helping candidates prepare for new roles. Always output in English.",
+                system_prompt=_PLAN_SYSTEM_PROMPT,
                 temperature=0.7
             )
             
@@ -192,26 +316,31 @@ IMPORTANT: Output must be in English only."""
             }
         except Exception as e:
             # Fallback to generic plan
-            return {
-                "30": [
-                    "Complete onboarding and setup development environment",
-                    "Meet with team members and key stakeholders",
-                    "Understand codebase architecture and documentation",
-                    "Complete first small feature or bug fix"
-                ],
-                "60": [
-                    "Deliver first significant feature independently",
-                    "Participate in code reviews and provide feedback",
-                    "Identify areas for process improvement",
-                    "Begin mentoring or pairing with junior developers"
-                ],
-                "90": [
-                    "Own a complete feature from design to deployment",
-                    "Contribute to technical discussions and architecture decisions",
-                    "Demonstrate expertise in key technologies",
-                    "Set goals for next quarter aligned with team objectives"
-                ]
-            }
+            return self._fallback_plan()
+    
+    @staticmethod
+    def _fallback_plan() -> Dict[str, List[str]]:
+        """Generic 30/60/90 plan used when the LLM can't produce a grounded one"""
+        return {
+            "30": [
+                "Complete onboarding and setup development environment",
+                "Meet with team members and key stakeholders",
+                "Understand codebase architecture and documentation",
+                "Complete first small feature or bug fix"
+            ],
+            "60": [
+                "Deliver first significant feature independently",
+                "Participate in code reviews and provide feedback",
+                "Identify areas for process improvement",
+                "Begin mentoring or pairing with junior developers"
+            ],
+            "90": [
+                "Own a complete feature from design to deployment",
+                "Contribute to technical discussions and architecture decisions",
+                "Demonstrate expertise in key technologies",
+                "Set goals for next quarter aligned with team objectives"
+            ]
+        }
     
     async def _generate_star_stories(
         self,
@@ -225,26 +354,16 @@ IMPORTANT: Output must be in English only."""
         """
         
         # Extract user's experience bullets as grounding material
-        experience_context = []
-        for idx, role in enumerate(profile.experience):
-            for bullet_idx, bullet in enumerate(role.bullets):
-                experience_context.append({
-                    "role_index": idx,
-                    "bullet_index": bullet_idx,
-                    "company": role.company,
-                    "title": role.title,
-                    "text": bullet.text,
-                    "evidence": bullet.evidence_ref
-                })
-        
-        if not experience_context:
+        bullets = tuple(
+            (role_idx, bullet_idx, role.company, role.title, bullet.text, bullet.evidence_ref)
+            for role_idx, role in enumerate(profile.experience)
+            for bullet_idx, bullet in enumerate(role.bullets)
+        )
+        
+        if not bullets:
             return []  # No experience to ground stories in
         
-        # Format experience for prompt
-        experience_text = "\n".join([
-            f"Experience {i}: [{exp['company']} - {exp['title']}] {exp['text']}"
-            for i, exp in enumerate(experience_context)
-        ])
+        experience_context, experience_text = _build_experience_context(bullets)
         
         prompt = f"""Create 3-5 STAR format interview stories based ONLY on the following real experience.
 DO NOT invent or fabricate any details not present in the experience bullets.
@@ -268,29 +387,11 @@ IMPORTANT:
 - Do not invent achievements or metrics
 - If no relevant experience exists for a skill, skip that story"""
         
-        from pydantic import BaseModel
-        
-        class GroundingRef(BaseModel):
-            experience_index: int
-            evidence_text: str
-        
-        class STARStoryModel(BaseModel):
-            title: str
-            situation: str
-            task: str
-            action: str
-            result: str
-            skills_demonstrated: List[str]
-            grounding_refs: List[GroundingRef]
-        
-        class STARStoriesResponse(BaseModel):
-            stories: List[STARStoryModel]
-        
         try:
             response = await self.llm_provider.generate_structured(
                 prompt=prompt,
                 response_model=STARStoriesResponse,
-                system_prompt="You are an interview coach who helps candidates structure their real experience into compelling STAR stories. Never fabricate details. Always output in English.",
+                system_prompt=_STAR_SYSTEM_PROMPT,
                 temperature=0.5  # Lower temperature for more grounded output
             )
             
@@ -327,6 +428,10 @@ IMPORTANT:
     async def _generate_interview_questions(self, job: JobPosting) -> List[InterviewQuestion]:
         """Generate thoughtful questions to ask the interviewer"""
         
+        # Without a description the LLM has nothing role-specific to work from
+        if not (job.description_clean or job.description_raw):
+            return self._fallback_interview_questions(job)
+        
         prompt = f"""Generate 5-7 insightful questions to ask during an interview for a {job.title} position at {job.company}.
 
 Job description excerpt: {(job.description_clean or job.description_raw or '')[:800]}
@@ -342,21 +447,11 @@ Categorize each question as: role, team, culture, growth, or technical
 
 IMPORTANT: Output must be in English only."""
         
-        from pydantic import BaseModel
-        
-        class QuestionModel(BaseModel):
-            question: str
-            category: str
-            reasoning: str
-        
-        class QuestionsResponse(BaseModel):
-            questions: List[QuestionModel]
-        
         try:
             response = await self.llm_provider.generate_structured(
                 prompt=prompt,
                 response_model=QuestionsResponse,
-                system_prompt="You are an interview coach helping candidates prepare thoughtful questions. Always output in English.",
+                system_prompt=_QUESTIONS_SYSTEM_PROMPT,
                 temperature=0.7
             )
             
@@ -371,23 +466,28 @@ IMPORTANT: Output must be in English only."""
             
         except Exception as e:
             # Fallback to generic but good questions
-            return [
-                InterviewQuestion(
-                    question=f"What does success look like for someone in the {job.title} role after 6 months?",
-                    category="role",
-                    reasoning="Helps understand expectations and success criteria"
-                ),
-                InterviewQuestion(
-                    question="How does the team approach technical decision-making and code reviews?",
-                    category="team",
-                    reasoning="Reveals team culture and collaboration practices"
-                ),
-                InterviewQuestion(
-                    question=f"What are the biggest challenges facing the team/product right now?",
-                    category="role",
-                    reasoning="Shows interest and reveals what you'd be working on"
-                )
-            ]
+            return self._fallback_interview_questions(job)
+    
+    @staticmethod
+    def _fallback_interview_questions(job: JobPosting) -> List[InterviewQuestion]:
+        """Generic interviewer questions used when the LLM can't produce specific ones"""
+        return [
+            InterviewQuestion(
+                question=f"What does success look like for someone in the {job.title} role after 6 months?",
+                category="role",
+                reasoning="Helps understand expectations and success criteria"
+            ),
+            InterviewQuestion(
+                question="How does the team approach technical decision-making and code reviews?",
+                category="team",
+                reasoning="Reveals team culture and collaboration practices"
+            ),
+            InterviewQuestion(
+                question=f"What are the biggest challenges facing the team/product right now?",
+                category="role",
+                reasoning="Shows interest and reveals what you'd be working on"
+            )
+        ]
     
     def _generate_study_checklist(
         self,
@@ -413,7 +513,7 @@ IMPORTANT: Output must be in English only."""
             ))
             
             # Add practice resource for technical skills
-            if any(keyword in gap.lower() for keyword in ['python', 'java', 'sql', 'algorithm', 'data structure']):
+            if _PRACTICE_KEYWORDS_RE.search(gap):
                 resources.append(StudyResource(
                     topic=gap,
                     resource_type="practice problems",
@@ -443,34 +543,18 @@ IMPORTANT: Output must be in English only."""
     ) -> List[str]:
         """Identify priority technical topics based on gaps and job requirements"""
         
-        # Start with gaps from tailoring plan
-        priority_topics = packet.tailoring_plan.gaps[:5]  # Top 5 gaps
-        
-        # Add key skills from job description
-        job_desc = (job.description_clean or job.description_raw or "").lower()
-        
-        # Common technical topics to check for
-        technical_keywords = {
-            "algorithms": ["algorithm", "data structure", "complexity"],
-            "system design": ["system design", "architecture", "scalability", "distributed"],
-            "python": ["python"],
-            "sql": ["sql", "database", "query"],
-            "api design": ["api", "rest", "graphql"],
-            "testing": ["test", "tdd", "unit test"],
-            "cloud": ["aws", "azure", "gcp", "cloud"],
-        }
+        # Start with gaps from tailoring plan; dict keys keep order and uniqueness
+        priority_topics = dict.fromkeys(packet.tailoring_plan.gaps[:5])  # Top 5 gaps
         
-        # Use set for faster lookups
-        priority_set = set(priority_topics)
+        # Add key skills from job description, found in one regex pass
+        job_desc = job.description_clean or job.description_raw or ""
+        matched = {m.lastgroup for m in _TOPIC_KEYWORDS_RE.finditer(job_desc)}
         
-        for topic, keywords in technical_keywords.items():
-            if any(keyword in job_desc for keyword in keywords):
-                topic_title = topic.title()
-                if topic_title not in priority_set:
-                    priority_topics.append(topic_title)
-                    priority_set.add(topic_title)
+        for topic, topic_title in _TOPIC_TITLES.items():
+            if topic in matched:
+                priority_topics.setdefault(topic_title)
         
-        return priority_topics[:7]  # Limit to 7 topics
+        return list(priority_topics)[:7]  # Limit to 7 topics
     
     async def _generate_qa_topics(
         self,
@@ -479,17 +563,22 @@ IMPORTANT: Output must be in English only."""
     ) -> List[TechnicalQATopic]:
         """Generate technical Q&A for each priority topic"""
         
-        topics = []
+        semaphore = asyncio.Semaphore(QA_TOPIC_CONCURRENCY)
         
-        for topic in priority_topics:
-            questions = await self._generate_topic_questions(topic, job)
-            if questions:
-                topics.append(TechnicalQATopic(
-                    topic=topic,
-                    questions=questions
-                ))
+        async def generate_bounded(topic: str) -> List[TechnicalQuestion]:
+            async with semaphore:
+                return await self._generate_topic_questions(topic, job)
+        
+        # Topics are independent; gather returns results in topic order
+        results = await asyncio.gather(
+            *(generate_bounded(topic) for topic in priority_topics)
+        )
         
-        return topics
+        return [
+            TechnicalQATopic(topic=topic, questions=questions)
+            for topic, questions in zip(priority_topics, results)
+            if questions
+        ]
     
     async def _generate_topic_questions(
         self,
@@ -498,6 +587,9 @@ IMPORTANT: Output must be in English only."""
     ) -> List[TechnicalQuestion]:
         """Generate questions for a specific technical topic"""
         
+        if not topic.strip():
+            return []
+        
         prompt = f"""Generate 6-9 technical interview questions for the topic: {topic}
 
 Context: Preparing for a {job.title} role
@@ -511,23 +603,11 @@ Focus on practical, real-world scenarios relevant to {job.title}.
 
 IMPORTANT: Output must be in English only."""
         
-        from pydantic import BaseModel
-        
-        class QuestionModel(BaseModel):
-            question: str
-            difficulty: DifficultyLevel
-            answer: str
-            follow_ups: List[str]
-            key_concepts: List[str]
-        
-        class TopicQuestionsResponse(BaseModel):
-            questions: List[QuestionModel]
-        
         try:
             response = await self.llm_provider.generate_structured(
                 prompt=prompt,
                 response_model=TopicQuestionsResponse,
-                system_prompt="You are a technical interviewer creating high-quality interview questions with detailed answers. Always output in English.",
+                system_prompt=_TOPIC_SYSTEM_PROMPT,
                 temperature=0.6
             )
             
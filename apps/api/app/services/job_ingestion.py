@@ -2,16 +2,33 @@
 Job ingestion service - orchestrates fetching from sources and storing in MongoDB
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import yaml
 import asyncio
+import copy
+import logging
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 from app.services.sources import Source, RSSSource, CompanySource
 from app.schemas import JobPosting, JobPostingInDB
 from app.models.database import Database
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+
+# Parsed configs keyed by path, stored with the file mtime they were read at
+# so the YAML is only re-parsed when it changes
+_CONFIG_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
 
 class JobIngestionService:
     """Service for ingesting jobs from configured sources"""
@@ -36,10 +53,17 @@ class JobIngestionService:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_path, "r") as f:
-                return yaml.safe_load(f)
+            key = str(self.config_path)
+            mtime = self.config_path.stat().st_mtime
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None or cached[0] != mtime:
+                with open(self.config_path, "r") as f:
+                    cached = (mtime, yaml.load(f, Loader=_YamlLoader))
+                _CONFIG_CACHE[key] = cached
+            # Sources mutate their config dicts, so hand out a private copy
+            return copy.deepcopy(cached[1])
         except Exception as e:
-            print(f"Error loading config from {self.config_path}: {e}")
+            logger.error(f"Error loading config from {self.config_path}: {e}")
             return {"sources": [], "settings": {}}
     
     def _initialize_sources(self) -> List[Source]:
@@ -64,12 +88,12 @@ class JobIngestionService:
                 elif source_type == "company":
                     source = CompanySource(source_config)
                 else:
-                    print(f"Unknown source type: {source_type}")
+                    logger.warning(f"Unknown source type: {source_type}")
                     continue
                 
                 sources.append(source)
             except Exception as e:
-                print(f"Error initializing source {source_config.get('name')}: {e}")
+                logger.error(f"Error initializing source {source_config.get('name')}: {e}")
                 continue
         
         return sources
@@ -86,32 +110,20 @@ class JobIngestionService:
         total_updated = 0
         sources_processed = []
         
-        for source in self.sources:
-            try:
-                # Respect rate limiting
-                await self._check_rate_limit(source)
-                
-                print(f"Fetching jobs from {source.name}...")
-                
-                # Fetch raw jobs
-                raw_jobs = await source.fetch()
-                total_fetched += len(raw_jobs)
-                
-                # Parse and store jobs
-                new_count, updated_count = await self._process_jobs(source, raw_jobs)
-                total_new += new_count
-                total_updated += updated_count
-                
-                sources_processed.append(source.name)
-                
-                # Update last fetch time
-                self.last_fetch_times[source.name] = datetime.utcnow()
-                
-                print(f"✓ {source.name}: {len(raw_jobs)} fetched, {new_count} new, {updated_count} updated")
-                
-            except Exception as e:
-                print(f"Error ingesting from {source.name}: {e}")
+        # Sources are independent and I/O-bound, so fetch them concurrently;
+        # gather keeps results in source order
+        results = await asyncio.gather(
+            *(self._ingest_source(source) for source in self.sources)
+        )
+        
+        for source, result in zip(self.sources, results):
+            if result is None:
                 continue
+            fetched, new_count, updated_count = result
+            total_fetched += fetched
+            total_new += new_count
+            total_updated += updated_count
+            sources_processed.append(source.name)
         
         return {
             "jobs_fetched": total_fetched,
@@ -120,17 +132,48 @@ class JobIngestionService:
             "sources_processed": sources_processed
         }
     
+    async def _ingest_source(self, source: Source) -> Optional[tuple[int, int, int]]:
+        """
+        Fetch and store jobs from a single source
+        
+        Returns:
+            Tuple of (fetched_count, new_count, updated_count), or None if the
+            source failed
+        """
+        try:
+            # Respect rate limiting
+            await self._check_rate_limit(source)
+            
+            logger.info(f"Fetching jobs from {source.name}...")
+            
+            # Fetch raw jobs
+            raw_jobs = await source.fetch()
+            
+            # Parse and store jobs
+            new_count, updated_count = await self._process_jobs(source, raw_jobs)
+            
+            # Update last fetch time
+            self.last_fetch_times[source.name] = datetime.now(timezone.utc)
+            
+            logger.info(f"{source.name}: {len(raw_jobs)} fetched, {new_count} new, {updated_count} updated")
+            
+            return len(raw_jobs), new_count, updated_count
+            
+        except Exception as e:
+            logger.error(f"Error ingesting from {source.name}: {e}")
+            return None
+    
     async def _check_rate_limit(self, source: Source):
         """Check and enforce rate limiting for a source"""
         if source.name not in self.last_fetch_times:
             return
         
         last_fetch = self.last_fetch_times[source.name]
-        elapsed = (datetime.utcnow() - last_fetch).total_seconds()
+        elapsed = (datetime.now(timezone.utc) - last_fetch).total_seconds()
         
         if elapsed < source.rate_limit_seconds:
             wait_time = source.rate_limit_seconds - elapsed
-            print(f"Rate limiting {source.name}: waiting {wait_time:.1f}s")
+            logger.info(f"Rate limiting {source.name}: waiting {wait_time:.1f}s")
             await asyncio.sleep(wait_time)
     
     async def _process_jobs(self, source: Source, raw_jobs: List) -> tuple[int, int]:
@@ -140,38 +183,52 @@ class JobIngestionService:
         Returns:
             Tuple of (new_count, updated_count)
         """
-        new_count = 0
-        updated_count = 0
-        
         db = Database.get_database()
         jobs_collection = db["jobs"]
         
+        # One timestamp for the whole batch
+        now = datetime.now(timezone.utc)
+        
+        # Parse everything up front, keeping the first posting per dedupe_hash
+        postings: Dict[str, JobPosting] = {}
+        duplicates = 0
         for raw_job in raw_jobs:
             try:
-                # Parse into JobPosting
                 job_posting = source.parse(raw_job)
-                
-                # Check if job already exists by dedupe_hash
-                existing = await jobs_collection.find_one({"dedupe_hash": job_posting.dedupe_hash})
-                
-                if existing:
-                    # Update last_seen
-                    await jobs_collection.update_one(
-                        {"dedupe_hash": job_posting.dedupe_hash},
-                        {"$set": {"last_seen": datetime.utcnow()}}
-                    )
-                    updated_count += 1
-                else:
-                    # Insert new job
-                    job_dict = job_posting.model_dump()
-                    await jobs_collection.insert_one(job_dict)
-                    new_count += 1
-                    
             except Exception as e:
-                print(f"Error processing job from {source.name}: {e}")
+                logger.error(f"Error processing job from {source.name}: {e}")
                 continue
+            if job_posting.dedupe_hash in postings:
+                duplicates += 1
+            else:
+                postings[job_posting.dedupe_hash] = job_posting
+        
+        if not postings:
+            return 0, duplicates
+        
+        # Upsert on dedupe_hash: new postings are inserted whole, known ones
+        # only get last_seen bumped; the unique index enforces dedup server-side
+        ops = []
+        for dedupe_hash, job_posting in postings.items():
+            job_dict = job_posting.model_dump()
+            job_dict.pop("last_seen", None)
+            ops.append(UpdateOne(
+                {"dedupe_hash": dedupe_hash},
+                {"$setOnInsert": job_dict, "$set": {"last_seen": now}},
+                upsert=True
+            ))
+        
+        try:
+            result = await jobs_collection.bulk_write(ops, ordered=False)
+            new_count = result.upserted_count
+            updated_count = result.matched_count
+        except BulkWriteError as e:
+            logger.error(f"Error storing jobs from {source.name}: {e.details.get('writeErrors')}")
+            new_count = e.details.get("nUpserted", 0)
+            updated_count = e.details.get("nMatched", 0)
         
-        return new_count, updated_count
+        # Repeats within the batch count as sightings of the first posting
+        return new_count, updated_count + duplicates
     
     def get_sources_info(self) -> List[Dict[str, Any]]:
         """Get information about configured sources"""
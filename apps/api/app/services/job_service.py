@@ -11,6 +11,10 @@ from app.schemas.job_queue import (
     BackgroundJobInDB,
     JobType,
     JobStatus,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    FAILED,
 )
 from app.models.database import get_background_jobs_collection
 
@@ -22,6 +26,7 @@ class JobService:
     
     # Job lock duration in seconds (5 minutes)
     LOCK_DURATION = 300
+    LOCK_DURATION_TD = timedelta(seconds=LOCK_DURATION)
     
     async def create_job(
         self,
@@ -34,19 +39,19 @@ class JobService:
         
         job = BackgroundJob(
             type=job_type,
-            status=JobStatus.QUEUED,
+            status=QUEUED,
             params=params or {},
             user_id=user_id,
         )
         
         job_dict = job.model_dump(by_alias=True, exclude={"id"})
-        result = await collection.insert_one(job_dict)
+        await collection.insert_one(job_dict)
         
-        job_dict["_id"] = str(result.inserted_id)
-        return BackgroundJobInDB(**job_dict)
+        # insert_one set job_dict["_id"] to the new ObjectId
+        return BackgroundJobInDB.from_mongo(job_dict)
     
     async def get_job(self, job_id: str) -> Optional[BackgroundJobInDB]:
-        """Get a job by ID"""
+        """Get a job by ID (use get_jobs_many to fetch several at once)"""
         collection = get_background_jobs_collection()
         
         try:
@@ -57,8 +62,33 @@ class JobService:
         if not job_data:
             return None
         
-        job_data["_id"] = str(job_data["_id"])
-        return BackgroundJobInDB(**job_data)
+        return BackgroundJobInDB.from_mongo(job_data)
+    
+    async def get_jobs_many(self, job_ids: List[str]) -> Dict[str, BackgroundJobInDB]:
+        """
+        Get several jobs by ID in a single query
+        
+        Prefer this over calling get_job in a loop, which costs one
+        round trip per job.
+        
+        Args:
+            job_ids: Job IDs; invalid IDs are skipped
+            
+        Returns:
+            Dict of job ID to job, for the jobs that exist
+        """
+        collection = get_background_jobs_collection()
+        
+        object_ids = [ObjectId(job_id) for job_id in job_ids if ObjectId.is_valid(job_id)]
+        if not object_ids:
+            return {}
+        
+        jobs = {}
+        async for job_data in collection.find({"_id": {"$in": object_ids}}):
+            job = BackgroundJobInDB.from_mongo(job_data)
+            jobs[job.id] = job
+        
+        return jobs
     
     async def list_jobs(
         self,
@@ -84,8 +114,7 @@ class JobService:
         
         jobs = []
         async for job_data in cursor:
-            job_data["_id"] = str(job_data["_id"])
-            jobs.append(BackgroundJobInDB(**job_data))
+            jobs.append(BackgroundJobInDB.from_mongo(job_data))
         
         return jobs, total
     
@@ -99,22 +128,22 @@ class JobService:
         collection = get_background_jobs_collection()
         
         now = datetime.utcnow()
-        lock_expires = now + timedelta(seconds=self.LOCK_DURATION)
+        lock_expires = now + self.LOCK_DURATION_TD
         
         # Find a queued job or a job whose lock has expired
         result = await collection.find_one_and_update(
             {
                 "$or": [
-                    {"status": JobStatus.QUEUED},
+                    {"status": QUEUED},
                     {
-                        "status": JobStatus.RUNNING,
+                        "status": RUNNING,
                         "lock_expires_at": {"$lt": now}
                     }
                 ]
             },
             {
                 "$set": {
-                    "status": JobStatus.RUNNING,
+                    "status": RUNNING,
                     "worker_id": worker_id,
                     "lock_expires_at": lock_expires,
                     "started_at": now,
@@ -127,8 +156,7 @@ class JobService:
         if not result:
             return None
         
-        result["_id"] = str(result["_id"])
-        return BackgroundJobInDB(**result)
+        return BackgroundJobInDB.from_mongo(result)
     
     async def update_progress(
         self,
@@ -157,8 +185,7 @@ class JobService:
         if not result:
             return None
         
-        result["_id"] = str(result["_id"])
-        return BackgroundJobInDB(**result)
+        return BackgroundJobInDB.from_mongo(result)
     
     async def complete_job(
         self,
@@ -170,7 +197,7 @@ class JobService:
         collection = get_background_jobs_collection()
         
         update_data = {
-            "status": JobStatus.SUCCEEDED,
+            "status": SUCCEEDED,
             "progress": 100,
             "finished_at": datetime.utcnow(),
             "worker_id": None,
@@ -194,8 +221,7 @@ class JobService:
         if not result_doc:
             return None
         
-        result_doc["_id"] = str(result_doc["_id"])
-        return BackgroundJobInDB(**result_doc)
+        return BackgroundJobInDB.from_mongo(result_doc)
     
     async def fail_job(
         self,
@@ -210,7 +236,7 @@ class JobService:
                 {"_id": ObjectId(job_id)},
                 {
                     "$set": {
-                        "status": JobStatus.FAILED,
+                        "status": FAILED,
                         "error": error,
                         "finished_at": datetime.utcnow(),
                         "worker_id": None,
@@ -225,8 +251,7 @@ class JobService:
         if not result:
             return None
         
-        result["_id"] = str(result["_id"])
-        return BackgroundJobInDB(**result)
+        return BackgroundJobInDB.from_mongo(result)
     
     async def renew_lock(
         self,
@@ -237,14 +262,14 @@ class JobService:
         collection = get_background_jobs_collection()
         
         now = datetime.utcnow()
-        lock_expires = now + timedelta(seconds=self.LOCK_DURATION)
+        lock_expires = now + self.LOCK_DURATION_TD
         
         try:
             result = await collection.find_one_and_update(
                 {
                     "_id": ObjectId(job_id),
                     "worker_id": worker_id,
-                    "status": JobStatus.RUNNING,
+                    "status": RUNNING,
                 },
                 {
                     "$set": {
@@ -259,5 +284,4 @@ class JobService:
         if not result:
             return None
         
-        result["_id"] = str(result["_id"])
-        return BackgroundJobInDB(**result)
+        return BackgroundJobInDB.from_mongo(result)
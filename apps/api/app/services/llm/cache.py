@@ -0,0 +1,140 @@
+"""In-process response cache for structured LLM calls"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Type, TypeVar
+from pydantic import BaseModel
+from .base import LLMProvider
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class LLMResponseCache:
+    """
+    LRU cache of validated LLM responses with a time-to-live
+    
+    Responses are stored as JSON and re-validated on a hit, so callers never
+    share (and mutate) the same model instance.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 3600):
+        """
+        Initialize response cache
+        
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl_seconds: How long a cached response stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        response_model: Type[BaseModel],
+        system_prompt: Optional[str],
+        temperature: float
+    ) -> str:
+        """Build a cache key from everything that shapes the response"""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (
+            model,
+            f"{response_model.__module__}.{response_model.__qualname__}",
+            system_prompt or "",
+            repr(temperature),
+            prompt,
+        ):
+            h.update(part.encode())
+            h.update(b"\0")
+        return h.hexdigest()
+    
+    def get(self, key: str, response_model: Type[T]) -> Optional[T]:
+        """Get a cached response, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, payload = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response_model.model_validate_json(payload)
+    
+    def set(self, key: str, response: BaseModel):
+        """Store a response, evicting the least recently used entries"""
+        self._entries[key] = (time.monotonic(), response.model_dump_json())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached responses"""
+        self._entries.clear()
+
+
+class CachedLLMProvider(LLMProvider):
+    """
+    LLM provider wrapper that serves repeated identical requests from a cache
+    
+    Only deterministic (temperature 0) requests are cached; sampled requests
+    always reach the provider, so asking again can give a different result.
+    """
+    
+    def __init__(self, provider: LLMProvider, cache: LLMResponseCache):
+        """
+        Initialize cached provider
+        
+        Args:
+            provider: Underlying provider that performs the actual LLM calls
+            cache: Response cache, typically shared across provider instances
+        """
+        self.provider = provider
+        self.cache = cache
+    
+    async def generate_structured(
+        self,
+        prompt: str,
+        response_model: Type[T],
+        system_prompt: str = None,
+        temperature: float = 0.7,
+        max_retries: int = 3
+    ) -> T:
+        """Generate structured output, reusing a cached response when available"""
+        if temperature != 0:
+            return await self.provider.generate_structured(
+                prompt=prompt,
+                response_model=response_model,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_retries=max_retries
+            )
+        
+        key = self.cache.make_key(
+            self.provider.get_model_name(),
+            prompt,
+            response_model,
+            system_prompt,
+            temperature
+        )
+        
+        cached = self.cache.get(key, response_model)
+        if cached is not None:
+            return cached
+        
+        response = await self.provider.generate_structured(
+            prompt=prompt,
+            response_model=response_model,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_retries=max_retries
+        )
+        self.cache.set(key, response)
+        return response
+    
+    def get_model_name(self) -> str:
+        """Get the underlying model name"""
+        return self.provider.get_model_name()
@@ -3,6 +3,14 @@ import os
 from typing import Optional
 from .base import LLMProvider
 from .openai_provider import OpenAILLMProvider
+from .cache import LLMResponseCache, CachedLLMProvider
+
+# Shared across provider instances, which are created per service/request.
+# LLM_CACHE_SIZE=0 disables response caching.
+_response_cache = LLMResponseCache(
+    maxsize=int(os.getenv("LLM_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+)
 
 
 def get_llm_provider(
@@ -19,7 +27,7 @@ def get_llm_provider(
         model: Model name to use. If None, uses provider default
         
     Returns:
-        LLMProvider instance
+        LLMProvider instance, wrapped with the shared response cache when enabled
         
     Raises:
         ValueError: If provider_type is unsupported
@@ -28,9 +36,13 @@ def get_llm_provider(
         provider_type = os.getenv("LLM_PROVIDER", "openai").lower()
     
     if provider_type == "openai":
-        return OpenAILLMProvider(
+        provider = OpenAILLMProvider(
             api_key=api_key,
             model=model or os.getenv("LLM_MODEL", "gpt-4o-mini")
         )
     else:
         raise ValueError(f"Unsupported LLM provider: {provider_type}")
+    
+    if _response_cache.maxsize > 0:
+        return CachedLLMProvider(provider, _response_cache)
+    return provider
@@ -1,14 +1,29 @@
 """OpenAI LLM provider implementation with structured output"""
 import os
 import json
+from functools import lru_cache
+import orjson
 from typing import Type, TypeVar
 from pydantic import BaseModel, ValidationError
-from openai import AsyncOpenAI
+from app.services.openai_client import get_openai_client
 from .base import LLMProvider
 
 T = TypeVar('T', bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def _schema_prompt_suffix(response_model: Type[BaseModel]) -> str:
+    """Schema instructions appended to prompts, built once per response model"""
+    schema = response_model.model_json_schema()
+    return f"""
+
+You must respond with valid JSON that matches this exact schema:
+
+{json.dumps(schema, indent=2)}
+
+Ensure all required fields are present and types match exactly. Return only the JSON object, no additional text."""
+
+
 class OpenAILLMProvider(LLMProvider):
     """OpenAI LLM provider using GPT-4 with JSON mode for structured outputs"""
     
@@ -25,7 +40,7 @@ class OpenAILLMProvider(LLMProvider):
             raise ValueError("OpenAI API key must be provided or set in OPENAI_API_KEY env var")
         
         self.model = model
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
     
     async def generate_structured(
         self,
@@ -44,17 +59,8 @@ class OpenAILLMProvider(LLMProvider):
         if not system_prompt:
             system_prompt = "You are a helpful assistant that generates structured data."
         
-        # Get JSON schema from Pydantic model
-        schema = response_model.model_json_schema()
-        
         # Enhance prompt with schema information
-        enhanced_prompt = f"""{prompt}
-
-You must respond with valid JSON that matches this exact schema:
-
-{json.dumps(schema, indent=2)}
-
-Ensure all required fields are present and types match exactly. Return only the JSON object, no additional text."""
+        enhanced_prompt = prompt + _schema_prompt_suffix(response_model)
         
         last_error = None
         for attempt in range(max_retries):
@@ -72,13 +78,13 @@ Ensure all required fields are present and types match exactly. Return only the
                 
                 # Extract JSON from response
                 content = response.choices[0].message.content
-                json_data = json.loads(content)
+                json_data = orjson.loads(content)
                 
                 # Validate against Pydantic model
                 validated_response = response_model.model_validate(json_data)
                 return validated_response
                 
-            except (json.JSONDecodeError, ValidationError) as e:
+            except (orjson.JSONDecodeError, ValidationError) as e:
                 last_error = e
                 if attempt < max_retries - 1:
                     # Retry with adjusted temperature (lower = more deterministic)
@@ -1,6 +1,8 @@
 """Configuration for job matching and scoring"""
 import os
-from typing import Dict
+import re
+from functools import lru_cache
+from typing import Dict, Tuple
 
 
 class MatchConfig:
@@ -26,36 +28,80 @@ class MatchConfig:
         "architect": 5,
     }
     
-    # Keywords for seniority detection in titles
-    JUNIOR_KEYWORDS = ["junior", "jr", "entry", "graduate", "intern", "associate"]
+    # Keywords for seniority detection in titles; matched as whole words, so
+    # common inflections are listed alongside their stems
+    JUNIOR_KEYWORDS = ["junior", "jr", "entry", "graduate", "intern", "internship", "associate"]
     MID_KEYWORDS = ["mid", "intermediate", "ii", "2"]
     SENIOR_KEYWORDS = ["senior", "sr", "iii", "3", "iv", "4"]
-    LEAD_KEYWORDS = ["lead", "staff", "principal", "architect", "director", "head"]
+    LEAD_KEYWORDS = ["lead", "leader", "leading", "staff", "principal", "architect", "director", "head"]
     
     # Recency decay (days)
     RECENCY_DECAY_DAYS = 90  # Jobs posted more than 90 days ago get lower score
     
+    # Minimum semantic score (0-1) for recompute to fully score a job;
+    # 0 scores every job
+    DEFAULT_MIN_SEMANTIC = 0.0
+    
     @classmethod
     def get_weights(cls) -> Dict[str, float]:
         """Get scoring weights from environment or use defaults"""
-        weights = {}
-        
-        # Try to read from environment variables
-        for component in cls.DEFAULT_WEIGHTS.keys():
-            env_key = f"MATCH_WEIGHT_{component.upper()}"
-            env_value = os.getenv(env_key)
-            
-            if env_value:
-                try:
-                    weights[component] = float(env_value)
-                except ValueError:
-                    weights[component] = cls.DEFAULT_WEIGHTS[component]
-            else:
-                weights[component] = cls.DEFAULT_WEIGHTS[component]
-        
-        # Normalize to ensure they sum to 1.0
-        total = sum(weights.values())
-        if total > 0:
-            weights = {k: v / total for k, v in weights.items()}
+        # Weights are read from the environment once; return a copy so
+        # callers can't alter the cached values
+        return dict(_load_weights())
+    
+    @classmethod
+    def get_min_semantic(cls) -> float:
+        """Get the recompute semantic score threshold from environment or use default"""
+        env_value = os.getenv("MATCH_MIN_SEMANTIC")
+        if env_value:
+            try:
+                return float(env_value)
+            except ValueError:
+                pass
+        return cls.DEFAULT_MIN_SEMANTIC
+    
+    @classmethod
+    def reset_weights_cache(cls) -> None:
+        """Re-read weights from the environment on the next get_weights call"""
+        _load_weights.cache_clear()
+
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one case-insensitive whole-word alternation"""
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b", re.IGNORECASE)
+
+
+# Title seniority patterns as (level, pattern), checked in order; first hit wins
+SENIORITY_PATTERNS: Tuple[Tuple[int, re.Pattern], ...] = (
+    (4, _keyword_pattern(MatchConfig.LEAD_KEYWORDS)),
+    (3, _keyword_pattern(MatchConfig.SENIOR_KEYWORDS)),
+    (2, _keyword_pattern(MatchConfig.MID_KEYWORDS)),
+    (1, _keyword_pattern(MatchConfig.JUNIOR_KEYWORDS)),
+)
+
+
+@lru_cache(maxsize=1)
+def _load_weights() -> Dict[str, float]:
+    """Read and normalize scoring weights from environment variables"""
+    weights = {}
+    
+    # Try to read from environment variables
+    for component in MatchConfig.DEFAULT_WEIGHTS.keys():
+        env_key = f"MATCH_WEIGHT_{component.upper()}"
+        env_value = os.getenv(env_key)
         
-        return weights
+        if env_value:
+            try:
+                weights[component] = float(env_value)
+            except ValueError:
+                weights[component] = MatchConfig.DEFAULT_WEIGHTS[component]
+        else:
+            weights[component] = MatchConfig.DEFAULT_WEIGHTS[component]
+    
+    # Normalize to ensure they sum to 1.0
+    total = sum(weights.values())
+    if total > 0:
+        weights = {k: v / total for k, v in weights.items()}
+    
+    return weights
@@ -1,17 +1,41 @@
 """Service for generating and managing job matches"""
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
+import numpy as np
 from bson import ObjectId
+from pymongo import UpdateOne
 
 from app.schemas.profile import UserProfile
 from app.schemas.job import JobPostingInDB
 from app.schemas.match import Match, ScoreBreakdown
 from app.services.embeddings.factory import EmbeddingProviderFactory
-from app.services.embeddings.cache import EmbeddingCache
+from app.services.embeddings.cache import EmbeddingCache, pack_embedding, unpack_embedding
 from app.services.matching.scoring import ScoringUtils
 from app.services.matching.config import MatchConfig
 from app.models.database import Database
 
+# Match upserts sent to MongoDB per bulk_write during recompute
+MATCH_WRITE_BATCH_SIZE = 500
+
+# Job fields read when matching (required JobPosting fields, those used for
+# embedding and scoring, and the stored embedding); skips description_raw
+# and tracking fields
+MATCH_JOB_PROJECTION = {
+    "company": 1,
+    "title": 1,
+    "url": 1,
+    "source_name": 1,
+    "source_type": 1,
+    "description_clean": 1,
+    "country": 1,
+    "city": 1,
+    "remote_type": 1,
+    "posted_date": 1,
+    "fetched_at": 1,
+    "embedding_vec": 1,
+    "embedding_model": 1,
+}
+
 
 class MatchGenerationService:
     """Service for computing job matches"""
@@ -20,10 +44,11 @@ class MatchGenerationService:
         self.embedding_provider = EmbeddingProviderFactory.create_provider()
         self.embedding_cache = EmbeddingCache()
         self.weights = MatchConfig.get_weights()
+        self.min_semantic = MatchConfig.get_min_semantic()
         self.matches_collection = Database.get_database()["matches"]
         self.jobs_collection = Database.get_database()["jobs"]
     
-    async def create_profile_embedding(self, profile: UserProfile) -> List[float]:
+    async def create_profile_embedding(self, profile: UserProfile) -> np.ndarray:
         """
         Create embedding for user profile
         
@@ -61,7 +86,7 @@ class MatchGenerationService:
         model_name = self.embedding_provider.get_model_name()
         cached = await self.embedding_cache.get(profile_text, model_name)
         
-        if cached:
+        if cached is not None:
             return cached
         
         # Generate embedding
@@ -70,19 +95,11 @@ class MatchGenerationService:
         # Cache it
         await self.embedding_cache.set(profile_text, model_name, embedding)
         
-        return embedding
+        return np.asarray(embedding, dtype=np.float32)
     
-    async def create_job_embedding(self, job: JobPostingInDB) -> List[float]:
-        """
-        Create embedding for job posting
-        
-        Args:
-            job: Job posting
-            
-        Returns:
-            Embedding vector
-        """
-        # Build job text
+    @staticmethod
+    def _job_embedding_text(job: JobPostingInDB) -> str:
+        """Build the text embedded for a job posting"""
         parts = [
             job.title,
             f"at {job.company}",
@@ -92,13 +109,91 @@ class MatchGenerationService:
             # Use first 2000 chars to stay within token limits
             parts.append(job.description_clean[:2000])
         
-        job_text = "\n".join(parts)
+        return "\n".join(parts)
+    
+    async def create_job_embeddings(self, jobs: List[JobPostingInDB]) -> List[np.ndarray]:
+        """
+        Create embeddings for many job postings at once
+        
+        Cached embeddings are fetched in one query and the misses are
+        embedded with batched provider requests, then cached together.
+        
+        Args:
+            jobs: Job postings
+            
+        Returns:
+            Embedding vectors in the same order as jobs
+        """
+        return await self.embedding_cache.get_or_compute_batch(
+            [self._job_embedding_text(job) for job in jobs],
+            self.embedding_provider.get_model_name(),
+            self.embedding_provider.get_embeddings,
+        )
+    
+    async def resolve_job_embeddings(
+        self,
+        jobs: List[JobPostingInDB],
+        stored: List[Optional[bytes]],
+    ) -> np.ndarray:
+        """
+        Get embeddings for jobs, preferring vectors stored on the job documents
+        
+        Jobs without a stored vector for the current model are embedded in
+        one batch, and the new vectors are written back to their documents
+        so later recomputes read them with the jobs themselves.
+        
+        Args:
+            jobs: Job postings
+            stored: Packed embedding stored on each job document for the
+                current model, or None
+            
+        Returns:
+            float32 matrix with one embedding row per job, in job order
+        """
+        embeddings = [
+            unpack_embedding(vec) if vec is not None else None for vec in stored
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not missing:
+            return np.vstack(embeddings)
+        
+        computed = await self.create_job_embeddings([jobs[i] for i in missing])
+        model_name = self.embedding_provider.get_model_name()
+        
+        ops = []
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+            if jobs[i].id:
+                ops.append(UpdateOne(
+                    {"_id": ObjectId(jobs[i].id)},
+                    {"$set": {
+                        "embedding_vec": pack_embedding(embedding),
+                        "embedding_model": model_name,
+                    }}
+                ))
+        
+        if ops:
+            await self.jobs_collection.bulk_write(ops, ordered=False)
+        
+        return np.vstack(embeddings).astype(np.float32, copy=False)
+    
+    async def create_job_embedding(self, job: JobPostingInDB) -> np.ndarray:
+        """
+        Create embedding for job posting
+        
+        Args:
+            job: Job posting
+            
+        Returns:
+            Embedding vector
+        """
+        job_text = self._job_embedding_text(job)
         
         # Check cache
         model_name = self.embedding_provider.get_model_name()
         cached = await self.embedding_cache.get(job_text, model_name)
         
-        if cached:
+        if cached is not None:
             return cached
         
         # Generate embedding
@@ -107,14 +202,19 @@ class MatchGenerationService:
         # Cache it
         await self.embedding_cache.set(job_text, model_name, embedding)
         
-        return embedding
+        return np.asarray(embedding, dtype=np.float32)
     
     def compute_match_score(
         self,
         profile: UserProfile,
         job: JobPostingInDB,
-        profile_embedding: List[float],
-        job_embedding: List[float],
+        profile_embedding: np.ndarray,
+        job_embedding: Optional[np.ndarray],
+        user_skills: Optional[Set[str]] = None,
+        user_seniority: Optional[int] = None,
+        semantic: Optional[float] = None,
+        job_skills: Optional[Set[str]] = None,
+        job_seniority: Optional[int] = None,
     ) -> Tuple[float, ScoreBreakdown]:
         """
         Compute match score and breakdown
@@ -124,6 +224,12 @@ class MatchGenerationService:
             job: Job posting
             profile_embedding: Profile embedding vector
             job_embedding: Job embedding vector
+            user_skills: Precomputed profile skills (derived from profile if None)
+            user_seniority: Precomputed profile seniority (derived from profile if None)
+            semantic: Precomputed semantic score, e.g. from a batched
+                similarity computation (computed from the embeddings if None)
+            job_skills: Precomputed job skills (extracted from job if None)
+            job_seniority: Precomputed job seniority (inferred from title if None)
             
         Returns:
             Tuple of (total_score, breakdown)
@@ -131,18 +237,24 @@ class MatchGenerationService:
         breakdown = ScoreBreakdown()
         
         # 1. Semantic similarity
-        breakdown.semantic = ScoringUtils.cosine_similarity_score(
-            profile_embedding, job_embedding
-        )
+        if semantic is None:
+            semantic = ScoringUtils.cosine_similarity_score(
+                profile_embedding, job_embedding
+            )
+        breakdown.semantic = semantic
         
         # 2. Skill overlap
-        user_skills = ScoringUtils.get_user_skills(profile)
-        job_skills = ScoringUtils.extract_skills_from_job(job)
+        if user_skills is None:
+            user_skills = ScoringUtils.get_user_skills(profile)
+        if job_skills is None:
+            job_skills = ScoringUtils.extract_skills_from_job(job)
         breakdown.skill_overlap = ScoringUtils.skill_overlap_score(user_skills, job_skills)
         
         # 3. Seniority fit
-        user_seniority = ScoringUtils.infer_user_seniority(profile)
-        job_seniority = ScoringUtils.infer_seniority_from_title(job.title)
+        if user_seniority is None:
+            user_seniority = ScoringUtils.infer_user_seniority(profile)
+        if job_seniority is None:
+            job_seniority = ScoringUtils.infer_seniority_from_title(job.title)
         breakdown.seniority_fit = ScoringUtils.seniority_fit_score(user_seniority, job_seniority)
         
         # 4. Location fit
@@ -167,7 +279,11 @@ class MatchGenerationService:
         profile: UserProfile,
         job: JobPostingInDB,
         breakdown: ScoreBreakdown,
-    ) -> Tuple[List[str], List[str], List[str]]:
+        user_skills: Optional[Set[str]] = None,
+        user_seniority: Optional[int] = None,
+        job_skills: Optional[Set[str]] = None,
+        job_seniority: Optional[int] = None,
+    ) -> Tuple[Tuple[str, ...], List[str], List[str]]:
         """
         Generate explainability: reasons, gaps, recommendations
         
@@ -175,17 +291,23 @@ class MatchGenerationService:
             profile: User profile
             job: Job posting
             breakdown: Score breakdown
+            user_skills: Precomputed profile skills (derived from profile if None)
+            user_seniority: Precomputed profile seniority (derived from profile if None)
+            job_skills: Precomputed job skills (extracted from job if None)
+            job_seniority: Precomputed job seniority (inferred from title if None)
             
         Returns:
-            Tuple of (top_reasons, gaps, recommendations)
+            Tuple of (top_reasons (at most 5), gaps, recommendations)
         """
         reasons = []
         gaps = []
         recommendations = []
         
         # Analyze each component
-        user_skills = ScoringUtils.get_user_skills(profile)
-        job_skills = ScoringUtils.extract_skills_from_job(job)
+        if user_skills is None:
+            user_skills = ScoringUtils.get_user_skills(profile)
+        if job_skills is None:
+            job_skills = ScoringUtils.extract_skills_from_job(job)
         
         # Skill overlap analysis
         matched_skills = user_skills & job_skills
@@ -201,8 +323,10 @@ class MatchGenerationService:
             recommendations.append(f"Consider learning: {missing_list[0]}")
         
         # Seniority analysis
-        user_seniority = ScoringUtils.infer_user_seniority(profile)
-        job_seniority = ScoringUtils.infer_seniority_from_title(job.title)
+        if user_seniority is None:
+            user_seniority = ScoringUtils.infer_user_seniority(profile)
+        if job_seniority is None:
+            job_seniority = ScoringUtils.infer_seniority_from_title(job.title)
         
         if breakdown.seniority_fit >= 0.7:
             reasons.append(f"Good seniority match for {job.title}")
@@ -228,16 +352,20 @@ class MatchGenerationService:
         if breakdown.semantic >= 0.7:
             reasons.append("Strong overall profile match")
         
-        # Limit to top 5 reasons
-        reasons = reasons[:5]
-        
-        return reasons, gaps, recommendations
+        # Limit to top 5 reasons; Match no longer validates the length
+        return tuple(reasons[:5]), gaps, recommendations
     
     async def generate_match(
         self,
         profile: UserProfile,
         profile_id: str,
         job: JobPostingInDB,
+        computed_at: Optional[datetime] = None,
+        profile_embedding: Optional[np.ndarray] = None,
+        user_skills: Optional[Set[str]] = None,
+        user_seniority: Optional[int] = None,
+        job_embedding: Optional[np.ndarray] = None,
+        semantic: Optional[float] = None,
     ) -> Match:
         """
         Generate a single match
@@ -246,22 +374,45 @@ class MatchGenerationService:
             profile: User profile
             profile_id: Profile ObjectId as string
             job: Job posting
+            computed_at: Timestamp shared by a recompute batch (defaults to now)
+            profile_embedding: Precomputed profile embedding (created if None)
+            user_skills: Precomputed profile skills (derived from profile if None)
+            user_seniority: Precomputed profile seniority (derived from profile if None)
+            job_embedding: Precomputed job embedding (created if None)
+            semantic: Precomputed semantic score (computed from the embeddings if None)
             
         Returns:
             Match object
         """
         # Get embeddings
-        profile_embedding = await self.create_profile_embedding(profile)
-        job_embedding = await self.create_job_embedding(job)
+        if profile_embedding is None:
+            profile_embedding = await self.create_profile_embedding(profile)
+        if job_embedding is None and semantic is None:
+            job_embedding = await self.create_job_embedding(job)
+        
+        # Profile-derived inputs are shared by scoring and explainability
+        if user_skills is None:
+            user_skills = ScoringUtils.get_user_skills(profile)
+        if user_seniority is None:
+            user_seniority = ScoringUtils.infer_user_seniority(profile)
+        
+        # Job-derived inputs are shared the same way
+        job_skills = ScoringUtils.extract_skills_from_job(job)
+        job_seniority = ScoringUtils.infer_seniority_from_title(job.title)
         
         # Compute scores
         total_score, breakdown = self.compute_match_score(
-            profile, job, profile_embedding, job_embedding
+            profile, job, profile_embedding, job_embedding,
+            user_skills=user_skills, user_seniority=user_seniority,
+            semantic=semantic,
+            job_skills=job_skills, job_seniority=job_seniority
         )
         
         # Generate explainability
         reasons, gaps, recommendations = self.generate_explainability(
-            profile, job, breakdown
+            profile, job, breakdown,
+            user_skills=user_skills, user_seniority=user_seniority,
+            job_skills=job_skills, job_seniority=job_seniority
         )
         
         # Create match
@@ -273,6 +424,7 @@ class MatchGenerationService:
             top_reasons=reasons,
             gaps=gaps,
             recommendations=recommendations,
+            computed_at=computed_at or datetime.utcnow(),
             embedding_model=self.embedding_provider.get_model_name(),
             posted_date=job.posted_date or job.fetched_at,
         )
@@ -300,33 +452,83 @@ class MatchGenerationService:
         # Convert to UserProfile
         profile = UserProfile(**profile_doc)
         
-        # Get all jobs
-        cursor = self.jobs_collection.find({})
-        jobs = await cursor.to_list(length=None)
-        
         matches_computed = 0
+        computed_at = datetime.utcnow()
         
-        # Generate matches for each job
-        for job_doc in jobs:
-            # Convert to JobPostingInDB
-            job_doc["id"] = str(job_doc["_id"])
-            job = JobPostingInDB(**job_doc)
-            
-            # Generate match
-            match = await self.generate_match(profile, profile_id, job)
+        # Profile-derived inputs are the same for every job; compute them once
+        profile_embedding = await self.create_profile_embedding(profile)
+        user_skills = ScoringUtils.get_user_skills(profile)
+        user_seniority = ScoringUtils.infer_user_seniority(profile)
+        
+        model_name = self.embedding_provider.get_model_name()
+        
+        async def process_batch(batch: List[JobPostingInDB], stored: List[Optional[bytes]]) -> int:
+            # Use embeddings stored on the jobs, embedding the rest in one
+            # batch, score semantic similarity in one matrix product, then
+            # upsert the matches in one bulk write
+            job_embeddings = await self.resolve_job_embeddings(batch, stored)
+            semantic_scores = ScoringUtils.cosine_similarity_scores(
+                profile_embedding, job_embeddings
+            )
             
-            # Store match (upsert)
-            match_dict = match.model_dump()
+            # Jobs below the semantic threshold skip the rest of scoring;
+            # drop any match left over from an earlier recompute
+            candidates = []
+            skipped_ids = []
+            for job, semantic in zip(batch, semantic_scores):
+                if semantic >= self.min_semantic:
+                    candidates.append((job, semantic))
+                elif job.id:
+                    skipped_ids.append(str(job.id))
             
-            await self.matches_collection.update_one(
-                {
+            if skipped_ids:
+                await self.matches_collection.delete_many({
                     "profile_id": profile_id,
-                    "job_id": match.job_id,
-                },
-                {"$set": match_dict},
-                upsert=True
-            )
+                    "job_id": {"$in": skipped_ids},
+                })
+            
+            ops = []
+            for job, semantic in candidates:
+                match = await self.generate_match(
+                    profile, profile_id, job, computed_at,
+                    profile_embedding=profile_embedding,
+                    user_skills=user_skills,
+                    user_seniority=user_seniority,
+                    semantic=semantic,
+                )
+                ops.append(UpdateOne(
+                    {
+                        "profile_id": profile_id,
+                        "job_id": match.job_id,
+                    },
+                    {"$set": match.model_dump()},
+                    upsert=True
+                ))
             
-            matches_computed += 1
+            if ops:
+                await self.matches_collection.bulk_write(ops, ordered=False)
+            return len(ops)
+        
+        # Stream jobs with only the fields matching reads, one write batch
+        # in memory at a time
+        cursor = self.jobs_collection.find(
+            {}, projection=MATCH_JOB_PROJECTION
+        ).batch_size(MATCH_WRITE_BATCH_SIZE)
+        
+        batch = []
+        stored = []
+        async for job_doc in cursor:
+            embedding_vec = job_doc.pop("embedding_vec", None)
+            if job_doc.pop("embedding_model", None) != model_name:
+                embedding_vec = None
+            batch.append(JobPostingInDB.from_mongo(job_doc))
+            stored.append(embedding_vec)
+            if len(batch) >= MATCH_WRITE_BATCH_SIZE:
+                matches_computed += await process_batch(batch, stored)
+                batch = []
+                stored = []
+        
+        if batch:
+            matches_computed += await process_batch(batch, stored)
         
         return matches_computed
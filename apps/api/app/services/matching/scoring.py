@@ -1,12 +1,12 @@
 """Scoring utilities for job matching"""
 import re
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Union
 from datetime import datetime, timedelta
 from sklearn.metrics.pairwise import cosine_similarity
 from app.schemas.profile import UserProfile
 from app.schemas.job import JobPostingInDB
-from .config import MatchConfig
+from .config import MatchConfig, SENIORITY_PATTERNS
 
 
 class ScoringUtils:
@@ -34,6 +34,40 @@ class ScoringUtils:
         # Normalize to [0, 1] range (cosine similarity is in [-1, 1])
         return (similarity + 1) / 2
     
+    @staticmethod
+    def cosine_similarity_scores(
+        embedding: Union[List[float], np.ndarray],
+        embeddings: Union[List[List[float]], np.ndarray]
+    ) -> List[float]:
+        """
+        Compute cosine similarity between one embedding and many at once
+        
+        Equivalent to calling cosine_similarity_score for each of
+        embeddings, but done as a single normalized matrix product.
+        
+        Args:
+            embedding: Reference embedding vector
+            embeddings: Embedding vectors to compare against, as a list or
+                an (n, dim) matrix
+            
+        Returns:
+            Cosine similarity scores between 0 and 1, in input order
+        """
+        if len(embeddings) == 0:
+            return []
+        
+        vec = np.asarray(embedding, dtype=np.float32)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        
+        # Zero vectors get a cosine of 0 (as sklearn does) instead of NaN
+        vec_norm = np.linalg.norm(vec)
+        row_norms = np.linalg.norm(matrix, axis=1)
+        row_norms[row_norms == 0] = 1.0
+        similarities = (matrix @ vec) / (row_norms * (vec_norm or 1.0))
+        
+        # Normalize to [0, 1] range (cosine similarity is in [-1, 1])
+        return ((similarities + 1) / 2).tolist()
+    
     @staticmethod
     def extract_skills_from_job(job: JobPostingInDB) -> Set[str]:
         """
@@ -143,27 +177,10 @@ class ScoringUtils:
         Returns:
             Seniority level (1-5)
         """
-        title_lower = title.lower()
-        
-        # Check for lead/principal first (highest)
-        for keyword in MatchConfig.LEAD_KEYWORDS:
-            if keyword in title_lower:
-                return 4
-        
-        # Check for senior
-        for keyword in MatchConfig.SENIOR_KEYWORDS:
-            if keyword in title_lower:
-                return 3
-        
-        # Check for mid
-        for keyword in MatchConfig.MID_KEYWORDS:
-            if keyword in title_lower:
-                return 2
-        
-        # Check for junior
-        for keyword in MatchConfig.JUNIOR_KEYWORDS:
-            if keyword in title_lower:
-                return 1
+        # Check from lead/principal (highest) down to junior
+        for level, pattern in SENIORITY_PATTERNS:
+            if pattern.search(title):
+                return level
         
         # Default to mid-level if no indicators
         return 2
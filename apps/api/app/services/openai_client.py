@@ -0,0 +1,21 @@
+"""Shared OpenAI client for the LLM and embedding providers"""
+from functools import lru_cache
+from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the process-wide AsyncOpenAI client for an API key
+    
+    Providers are created per service instance, so sharing the client lets
+    them reuse one HTTP connection pool (and its TLS connections) instead of
+    each opening their own.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        AsyncOpenAI client
+    """
+    return AsyncOpenAI(api_key=api_key)
@@ -110,10 +110,10 @@ class PacketStorageService:
         collection = get_packets_collection()
         
         packet_dict = packet.model_dump(by_alias=True, exclude={"id"})
-        result = await collection.insert_one(packet_dict)
+        await collection.insert_one(packet_dict)
         
-        packet_in_db = PacketInDB(**packet_dict, id=str(result.inserted_id))
-        return packet_in_db
+        # insert_one set packet_dict["_id"] to the new ObjectId
+        return PacketInDB.from_mongo(packet_dict)
     
     async def get_packet(self, packet_id: str) -> Optional[PacketInDB]:
         """Retrieve packet metadata from MongoDB"""
@@ -127,8 +127,7 @@ class PacketStorageService:
         if not packet_data:
             return None
         
-        packet_data["_id"] = str(packet_data["_id"])
-        return PacketInDB(**packet_data)
+        return PacketInDB.from_mongo(packet_data)
     
     async def list_packets(
         self,
@@ -151,8 +150,7 @@ class PacketStorageService:
         
         packets = []
         async for packet_data in cursor:
-            packet_data["_id"] = str(packet_data["_id"])
-            packets.append(PacketInDB(**packet_data))
+            packets.append(PacketInDB.from_mongo(packet_data))
         
         return packets, total
     
@@ -174,8 +172,7 @@ class PacketStorageService:
         if not result:
             return None
         
-        result["_id"] = str(result["_id"])
-        return PacketInDB(**result)
+        return PacketInDB.from_mongo(result)
     
     def cleanup_packet_files(self, packet_id: str):
         """Delete all files for a packet"""
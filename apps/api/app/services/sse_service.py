@@ -3,11 +3,11 @@ Server-Sent Events (SSE) service for real-time updates
 """
 import asyncio
 import logging
-from typing import AsyncGenerator, Optional, Dict, Any
+from typing import AsyncGenerator, Optional, Dict, Any, Union
 from datetime import datetime
-import json
+import orjson
 
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import SSEEvent, SSEEventDict
 from app.models.database import Database
 
 logger = logging.getLogger(__name__)
@@ -41,9 +41,20 @@ class SSEService:
             if not self._subscribers[key]:
                 del self._subscribers[key]
     
-    async def emit(self, event: SSEEvent):
-        """Emit an event to all subscribers"""
-        key = event.user_id or "global"
+    async def emit(self, event: Union[SSEEventDict, SSEEvent]):
+        """
+        Emit an event to all subscribers
+        
+        Internal producers pass a plain SSEEventDict; SSEEvent models from
+        external producers are flattened to the same shape.
+        """
+        if isinstance(event, SSEEvent):
+            event = event.model_dump(by_alias=True)
+        else:
+            event.setdefault("timestamp", datetime.utcnow())
+        
+        user_id = event.get("user_id")
+        key = user_id or "global"
         
         # Also store in database for reconnect support
         await self._store_event(event)
@@ -62,24 +73,25 @@ class SSEService:
             
             # Remove dead queues
             for dead_queue in dead_queues:
-                self.unsubscribe(dead_queue, event.user_id)
+                self.unsubscribe(dead_queue, user_id)
     
-    async def _store_event(self, event: SSEEvent):
+    async def _store_event(self, event: SSEEventDict):
         """Store event in database for reconnect support"""
         try:
             db = Database.get_database()
             events_collection = db["events"]
             
-            event_dict = event.model_dump(by_alias=True, exclude={"id"})
-            await events_collection.insert_one(event_dict)
+            user_id = event.get("user_id")
+            # Copy so the driver's generated _id doesn't leak into the queued event
+            await events_collection.insert_one(dict(event))
             
             # Keep only last 1000 events per user
             # This is a simple approach; for production, consider TTL indexes
-            count = await events_collection.count_documents({"user_id": event.user_id})
+            count = await events_collection.count_documents({"user_id": user_id})
             if count > 1000:
                 # Delete oldest events
                 cursor = events_collection.find(
-                    {"user_id": event.user_id}
+                    {"user_id": user_id}
                 ).sort("timestamp", 1).limit(count - 1000)
                 
                 ids_to_delete = [doc["_id"] async for doc in cursor]
@@ -107,7 +119,6 @@ class SSEService:
             
             events = []
             async for event_data in cursor:
-                event_data["_id"] = str(event_data["_id"])
                 events.append(SSEEvent(**event_data))
             
             return list(reversed(events))  # Return in chronological order
@@ -124,20 +135,17 @@ class SSEService:
         
         try:
             # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
+            connected = orjson.dumps({"type": "connected", "timestamp": datetime.utcnow()})
+            yield f"data: {connected.decode()}\n\n"
             
             while True:
                 try:
                     # Wait for events with a timeout to send keepalive
                     event = await asyncio.wait_for(queue.get(), timeout=30.0)
                     
-                    # Format as SSE
-                    event_data = event.model_dump(by_alias=True, exclude={"id"})
-                    # Convert datetime to ISO format
-                    event_data["timestamp"] = event_data["timestamp"].isoformat()
-                    
-                    yield f"event: {event.event_type}\n"
-                    yield f"data: {json.dumps(event_data)}\n\n"
+                    # Format as SSE; orjson encodes the datetime as ISO 8601
+                    yield f"event: {event['type']}\n"
+                    yield f"data: {orjson.dumps(event).decode()}\n\n"
                     
                 except asyncio.TimeoutError:
                     # Send keepalive comment
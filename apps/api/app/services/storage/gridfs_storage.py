@@ -5,7 +5,7 @@ import hashlib
 import logging
 from typing import Optional, BinaryIO
 from io import BytesIO
-from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from gridfs import AsyncGridFSBucket
 from bson import ObjectId
 
 from app.models.database import Database
@@ -25,13 +25,13 @@ class GridFSStorage(ArtifactStorage):
             bucket_name: Name of the GridFS bucket (default: "artifacts")
         """
         self.bucket_name = bucket_name
-        self._bucket: Optional[AsyncIOMotorGridFSBucket] = None
+        self._bucket: Optional[AsyncGridFSBucket] = None
     
-    def _get_bucket(self) -> AsyncIOMotorGridFSBucket:
+    def _get_bucket(self) -> AsyncGridFSBucket:
         """Get or create GridFS bucket"""
         if self._bucket is None:
             db = Database.get_database()
-            self._bucket = AsyncIOMotorGridFSBucket(db, bucket_name=self.bucket_name)
+            self._bucket = AsyncGridFSBucket(db, bucket_name=self.bucket_name)
         return self._bucket
     
     async def save_file(
@@ -140,3 +140,16 @@ def test_cv_document_preserves_upload_date():
     )
     
     assert cv.upload_date == upload_time
+
+
+def test_cv_document_upload_date_default_per_instance():
+    """Test that default upload_date is evaluated per instance, not at import"""
+    before = datetime.utcnow()
+    cv = CVDocument(
+        user_email="test@example.com",
+        filename="resume.pdf",
+        extracted_text="text",
+        parsed_profile={}
+    )
+    
+    assert cv.upload_date >= before
@@ -42,6 +42,14 @@ def test_extract_links():
     assert any("linkedin" in link for link in links)
 
 
+def test_extract_links_case_insensitive():
+    """Test social links are matched regardless of case and normalized to lowercase"""
+    text = "Find me on LinkedIn.com/in/JohnDoe and GitHub.com/JohnDoe"
+    links = CVExtractor.extract_links(text)
+    assert "linkedin.com/in/johndoe" in links
+    assert "github.com/johndoe" in links
+
+
 def test_extract_skills():
     """Test skill extraction and grouping"""
     text = """
@@ -58,6 +66,28 @@ def test_extract_skills():
     assert any("Programming Languages" in cat for cat in categories)
 
 
+def test_extract_sections_match_headers_in_any_case():
+    """Test section headers are found regardless of case without inventing entries"""
+    text = """
+    EDUCATION
+    University of Technology
+    2016-2020
+    """
+    assert CVExtractor.extract_education(text) == []
+    assert CVExtractor.extract_experience("WORK HISTORY\nSenior Developer\n", []) == []
+
+
+def test_extract_skills_whole_tokens():
+    """Test skills match whole tokens, not substrings of unrelated words"""
+    text = "Managed cargo routes for a growing rail operator. Built tools in Node.js and C++."
+    skill_groups = CVExtractor.extract_skills(text)
+    skills = {skill for sg in skill_groups for skill in sg.skills}
+    assert "Go" not in skills
+    assert "R" not in skills
+    assert "Node.Js" in skills
+    assert "C++" in skills
+
+
 def test_create_draft_profile():
     """Test creating a draft profile from text"""
     text = """
@@ -83,14 +113,19 @@ def test_create_draft_profile():
     University of Technology | 2016-2020
     """
     
-    evidence_map = {}
-    profile = CVExtractor.create_draft_profile(text, evidence_map)
+    evidence = []
+    profile = CVExtractor.create_draft_profile(text, evidence)
     
     assert isinstance(profile, UserProfile)
     assert profile.email == "john.doe@example.com"
     assert "John Doe" in profile.name
     assert len(profile.skills) > 0
-    # Don't assert on experience length as extraction is heuristic-based
+    
+    # No hallucination: no roles or schools with placeholder values
+    assert all(role.company != "Company Name" for role in profile.experience)
+    assert all(role.dates != "Dates" for role in profile.experience)
+    assert profile.experience == []
+    assert profile.education == []
 
 
 def test_extract_text_from_pdf():
@@ -115,6 +115,38 @@ def test_dedupe_hash_case_insensitive():
     assert job1.dedupe_hash == job2.dedupe_hash
 
 
+def test_dedupe_hash_stable_format():
+    """Test that dedupe hash matches the stored company|title|url format"""
+    import hashlib
+    
+    job = JobPosting(
+        company="  Müller GmbH ",
+        title="Senior ENGINEER",
+        url=" https://example.com/Jobs/1 ",
+        source_name="Source",
+        source_type="rss"
+    )
+    
+    expected = hashlib.sha256(
+        "müller gmbh|senior engineer|https://example.com/jobs/1".encode()
+    ).hexdigest()
+    assert job.dedupe_hash == expected
+
+
+def test_dedupe_hash_included_in_dump():
+    """Test that the computed dedupe hash is persisted with the document"""
+    job = JobPosting(
+        company="Tech Corp",
+        title="Engineer",
+        url="https://example.com/job/1",
+        source_name="Source",
+        source_type="rss"
+    )
+
+    data = job.model_dump()
+    assert data["dedupe_hash"] == job.generate_hash()
+
+
 def test_job_posting_with_dates():
     """Test JobPosting with optional date fields"""
     posted_date = datetime(2024, 1, 15, 10, 30)
@@ -147,3 +179,26 @@ def test_job_posting_remote_types():
             remote_type=remote_type
         )
         assert job.remote_type == remote_type
+
+
+def test_job_posting_from_mongo_document():
+    """Test building JobPostingInDB from a raw MongoDB document"""
+    from bson import ObjectId
+    
+    object_id = ObjectId()
+    doc = {
+        "_id": object_id,
+        "company": "Tech Corp",
+        "title": "Developer",
+        "url": "https://techcorp.com/jobs/1",
+        "source_name": "Source",
+        "source_type": "rss",
+    }
+    
+    job = JobPostingInDB.from_mongo(doc)
+    
+    assert job.id == str(object_id)
+    assert doc["_id"] is object_id
+    # API responses keep exposing the id as `_id`
+    assert job.model_dump(by_alias=True)["_id"] == str(object_id)
+
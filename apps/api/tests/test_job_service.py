@@ -1,7 +1,17 @@
 """Tests for job service and background jobs"""
 import pytest
 from datetime import datetime, timedelta
-from app.schemas.job_queue import JobType, JobStatus, BackgroundJob
+from app.schemas.job_queue import (
+    BackgroundJob,
+    JOB_INGESTION,
+    MATCH_RECOMPUTE,
+    PACKET_GENERATION,
+    INTERVIEW_GENERATION,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    FAILED,
+)
 from app.services.job_service import JobService
 
 
@@ -14,13 +24,13 @@ class TestJobService:
         service = JobService()
         
         job = await service.create_job(
-            job_type=JobType.JOB_INGESTION,
+            job_type=JOB_INGESTION,
             params={"test": "value"},
             user_id="test_user"
         )
         
-        assert job.type == JobType.JOB_INGESTION
-        assert job.status == JobStatus.QUEUED
+        assert job.type == JOB_INGESTION
+        assert job.status == QUEUED
         assert job.params["test"] == "value"
         assert job.user_id == "test_user"
         assert job.progress == 0
@@ -32,7 +42,7 @@ class TestJobService:
         
         # Create a job
         created_job = await service.create_job(
-            job_type=JobType.MATCH_RECOMPUTE,
+            job_type=MATCH_RECOMPUTE,
             params={}
         )
         
@@ -41,32 +51,44 @@ class TestJobService:
         
         assert retrieved_job is not None
         assert retrieved_job.id == created_job.id
-        assert retrieved_job.type == JobType.MATCH_RECOMPUTE
+        assert retrieved_job.type == MATCH_RECOMPUTE
+    
+    async def test_get_jobs_many(self):
+        """Test retrieving several jobs in one call"""
+        service = JobService()
+        
+        job1 = await service.create_job(job_type=JOB_INGESTION, params={})
+        job2 = await service.create_job(job_type=MATCH_RECOMPUTE, params={})
+        
+        jobs = await service.get_jobs_many([job1.id, job2.id, "not-an-id"])
+        
+        assert set(jobs) == {job1.id, job2.id}
+        assert jobs[job2.id].type == MATCH_RECOMPUTE
     
     async def test_list_jobs(self):
         """Test listing jobs with filters"""
         service = JobService()
         
         # Create multiple jobs
-        await service.create_job(job_type=JobType.JOB_INGESTION, params={})
-        await service.create_job(job_type=JobType.MATCH_RECOMPUTE, params={})
-        await service.create_job(job_type=JobType.JOB_INGESTION, params={})
+        await service.create_job(job_type=JOB_INGESTION, params={})
+        await service.create_job(job_type=MATCH_RECOMPUTE, params={})
+        await service.create_job(job_type=JOB_INGESTION, params={})
         
         # List all jobs
         jobs, total = await service.list_jobs()
         assert total >= 3
         
         # List by type
-        jobs, total = await service.list_jobs(job_type=JobType.JOB_INGESTION)
+        jobs, total = await service.list_jobs(job_type=JOB_INGESTION)
         assert total >= 2
-        assert all(j.type == JobType.JOB_INGESTION for j in jobs)
+        assert all(j.type == JOB_INGESTION for j in jobs)
     
     async def test_acquire_job_atomic(self):
         """Test that job acquisition is atomic (only one worker gets it)"""
         service = JobService()
         
         # Create a job
-        await service.create_job(job_type=JobType.PACKET_GENERATION, params={})
+        await service.create_job(job_type=PACKET_GENERATION, params={})
         
         # Two workers try to acquire
         worker1_job = await service.acquire_job("worker1")
@@ -75,7 +97,7 @@ class TestJobService:
         # Only one should get a job
         assert worker1_job is not None
         assert worker2_job is None  # No more queued jobs
-        assert worker1_job.status == JobStatus.RUNNING
+        assert worker1_job.status == RUNNING
         assert worker1_job.worker_id == "worker1"
     
     async def test_update_progress(self):
@@ -83,7 +105,7 @@ class TestJobService:
         service = JobService()
         
         # Create a job
-        job = await service.create_job(job_type=JobType.JOB_INGESTION, params={})
+        job = await service.create_job(job_type=JOB_INGESTION, params={})
         
         # Update progress
         updated = await service.update_progress(job.id, 50, "Half done")
@@ -97,7 +119,7 @@ class TestJobService:
         service = JobService()
         
         # Create and acquire a job
-        job = await service.create_job(job_type=JobType.JOB_INGESTION, params={})
+        job = await service.create_job(job_type=JOB_INGESTION, params={})
         acquired = await service.acquire_job("worker1")
         
         # Complete it
@@ -108,7 +130,7 @@ class TestJobService:
         )
         
         assert completed is not None
-        assert completed.status == JobStatus.SUCCEEDED
+        assert completed.status == SUCCEEDED
         assert completed.progress == 100
         assert completed.result["jobs_new"] == 10
         assert completed.resource_refs["job_id"] == "some_id"
@@ -120,14 +142,14 @@ class TestJobService:
         service = JobService()
         
         # Create and acquire a job
-        job = await service.create_job(job_type=JobType.MATCH_RECOMPUTE, params={})
+        job = await service.create_job(job_type=MATCH_RECOMPUTE, params={})
         acquired = await service.acquire_job("worker1")
         
         # Fail it
         failed = await service.fail_job(job.id, "Something went wrong")
         
         assert failed is not None
-        assert failed.status == JobStatus.FAILED
+        assert failed.status == FAILED
         assert failed.error == "Something went wrong"
         assert failed.finished_at is not None
         assert failed.worker_id is None
@@ -137,7 +159,7 @@ class TestJobService:
         service = JobService()
         
         # Create a job
-        job = await service.create_job(job_type=JobType.INTERVIEW_GENERATION, params={})
+        job = await service.create_job(job_type=INTERVIEW_GENERATION, params={})
         
         # Worker 1 acquires it
         acquired1 = await service.acquire_job("worker1")
@@ -164,7 +186,7 @@ class TestJobService:
         service = JobService()
         
         # Create and acquire a job
-        job = await service.create_job(job_type=JobType.PACKET_GENERATION, params={})
+        job = await service.create_job(job_type=PACKET_GENERATION, params={})
         acquired = await service.acquire_job("worker1")
         
         original_expiry = acquired.lock_expires_at
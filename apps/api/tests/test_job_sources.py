@@ -204,3 +204,105 @@ def test_html_cleaning():
     assert "<a" not in cleaned
     assert "great" in cleaned
     assert "benefits" in cleaned
+
+
+@pytest.mark.asyncio
+async def test_process_jobs_bulk_upserts():
+    """Test that a fetched batch is stored as one bulk write of upserts"""
+    from datetime import datetime, timezone
+    from unittest.mock import AsyncMock, MagicMock, patch
+    from pymongo import UpdateOne
+    from app.services.job_ingestion import JobIngestionService
+    
+    source = RSSSource({
+        "name": "Test RSS",
+        "type": "rss",
+        "url": "https://example.com/feed",
+        "compliance_note": "Public feed",
+        "rate_limit_seconds": 60
+    })
+    raw_jobs = [
+        RawJob(title="Developer", url="https://example.com/job/1", company="Tech Corp"),
+        RawJob(title="Developer", url="https://example.com/job/1", company="Tech Corp"),
+        RawJob(title="Designer", url="https://example.com/job/2", company="Tech Corp"),
+    ]
+    
+    # Fixed timestamps so the expected operations can be built exactly
+    fetched_at = datetime(2024, 1, 1)
+    now = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    
+    def parse(raw_job):
+        return JobPosting(
+            company=raw_job.company,
+            title=raw_job.title,
+            url=raw_job.url,
+            source_name=source.name,
+            source_type="rss",
+            fetched_at=fetched_at,
+            first_seen=fetched_at,
+            last_seen=fetched_at,
+        )
+    
+    def expected_op(raw_job):
+        job_dict = parse(raw_job).model_dump()
+        job_dict.pop("last_seen")
+        return UpdateOne(
+            {"dedupe_hash": job_dict["dedupe_hash"]},
+            {"$setOnInsert": job_dict, "$set": {"last_seen": now}},
+            upsert=True
+        )
+    
+    collection = MagicMock()
+    collection.bulk_write = AsyncMock(
+        return_value=MagicMock(upserted_count=1, matched_count=1)
+    )
+    
+    service = JobIngestionService.__new__(JobIngestionService)
+    with patch("app.services.job_ingestion.Database.get_database",
+               return_value={"jobs": collection}), \
+         patch("app.services.job_ingestion.datetime") as mock_datetime, \
+         patch.object(source, "parse", side_effect=parse):
+        mock_datetime.now.return_value = now
+        new_count, updated_count = await service._process_jobs(source, raw_jobs)
+    
+    assert (new_count, updated_count) == (1, 2)
+    collection.bulk_write.assert_awaited_once_with(
+        [expected_op(raw_jobs[0]), expected_op(raw_jobs[2])], ordered=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_jobs_dedupe_index_replaces_legacy_index():
+    """Test that the legacy content_hash index is dropped before dedupe_hash is indexed"""
+    from unittest.mock import AsyncMock, MagicMock
+    from pymongo.errors import OperationFailure
+    from app.main import ensure_jobs_dedupe_index
+    
+    collection = MagicMock()
+    collection.drop_index = AsyncMock()
+    collection.create_index = AsyncMock()
+    
+    await ensure_jobs_dedupe_index(collection)
+    
+    collection.drop_index.assert_awaited_once_with("content_hash_1")
+    collection.create_index.assert_awaited_once_with([("dedupe_hash", 1)], unique=True)
+    
+    # Fresh databases have no legacy index to drop
+    collection.drop_index = AsyncMock(side_effect=OperationFailure("index not found", code=27))
+    await ensure_jobs_dedupe_index(collection)
+
+
+@pytest.mark.asyncio
+async def test_jobs_dedupe_index_failure_is_contained():
+    """Test that duplicate jobs blocking the unique index don't raise"""
+    from unittest.mock import AsyncMock, MagicMock
+    from pymongo.errors import DuplicateKeyError
+    from app.main import ensure_jobs_dedupe_index
+    
+    collection = MagicMock()
+    collection.drop_index = AsyncMock()
+    collection.create_index = AsyncMock(side_effect=DuplicateKeyError("E11000 duplicate key"))
+    
+    await ensure_jobs_dedupe_index(collection)
+    
+    collection.create_index.assert_awaited_once()
@@ -1,5 +1,6 @@
 """Tests for match scoring and embedding services"""
 import pytest
+import numpy as np
 from unittest.mock import AsyncMock, Mock
 from datetime import datetime, timedelta
 
@@ -88,6 +89,20 @@ class TestScoringDeterminism:
         assert score1 == score2 == score3
         assert 0 <= score1 <= 1
     
+    def test_batched_cosine_similarity_matches_pairwise(self):
+        """Test that batched similarity scores equal per-pair scores"""
+        profile_embedding = [0.1, 0.2, 0.3, 0.4]
+        job_embeddings = [[0.4, 0.3, 0.2, 0.1], [-0.1, -0.2, -0.3, -0.4], [0.0, 0.0, 0.0, 0.0]]
+        
+        scores = ScoringUtils.cosine_similarity_scores(profile_embedding, job_embeddings)
+        
+        expected = [
+            ScoringUtils.cosine_similarity_score(profile_embedding, job_embedding)
+            for job_embedding in job_embeddings
+        ]
+        assert scores == pytest.approx(expected, abs=1e-6)
+        assert ScoringUtils.cosine_similarity_scores(profile_embedding, []) == []
+    
     def test_skill_extraction_deterministic(self, sample_job):
         """Test that skill extraction is deterministic"""
         skills1 = ScoringUtils.extract_skills_from_job(sample_job)
@@ -262,6 +277,18 @@ class TestSeniorityInference:
         for title in titles:
             level = ScoringUtils.infer_seniority_from_title(title)
             assert level in [4, 5], f"Failed for title: {title}"
+    
+    def test_keywords_match_whole_words(self):
+        """Test that seniority keywords inside other words are ignored"""
+        assert ScoringUtils.infer_seniority_from_title("International Account Manager") == 2
+        assert ScoringUtils.infer_seniority_from_title("Python3 Developer") == 2
+        assert ScoringUtils.infer_seniority_from_title("Sr. Backend Engineer") == 3
+    
+    def test_keyword_inflections_still_match(self):
+        """Test that common inflected forms of seniority keywords are detected"""
+        assert ScoringUtils.infer_seniority_from_title("Software Engineering Internship") == 1
+        assert ScoringUtils.infer_seniority_from_title("Team Leader") == 4
+        assert ScoringUtils.infer_seniority_from_title("Leading Engineer") == 4
 
 
 class TestLocationFitScoring:
@@ -386,3 +413,325 @@ class TestWeightsConfiguration:
         for component in required_components:
             assert component in weights
             assert 0 <= weights[component] <= 1
+    
+    def test_weights_read_from_env_once(self, monkeypatch):
+        """Test that env weights are cached until the cache is reset"""
+        MatchConfig.reset_weights_cache()
+        monkeypatch.setenv("MATCH_WEIGHT_SEMANTIC", "3")
+        try:
+            weights = MatchConfig.get_weights()
+            assert weights["semantic"] == pytest.approx(3 / 3.65)
+            
+            # Later env changes are ignored until reset
+            monkeypatch.setenv("MATCH_WEIGHT_SEMANTIC", "0.35")
+            assert MatchConfig.get_weights() == weights
+            
+            # Callers get their own copy
+            weights["semantic"] = 0
+            assert MatchConfig.get_weights()["semantic"] == pytest.approx(3 / 3.65)
+        finally:
+            MatchConfig.reset_weights_cache()
+    
+    def test_min_semantic_from_env(self, monkeypatch):
+        """Test that the semantic threshold defaults to scoring every job"""
+        monkeypatch.delenv("MATCH_MIN_SEMANTIC", raising=False)
+        assert MatchConfig.get_min_semantic() == 0.0
+        
+        monkeypatch.setenv("MATCH_MIN_SEMANTIC", "0.6")
+        assert MatchConfig.get_min_semantic() == 0.6
+        
+        monkeypatch.setenv("MATCH_MIN_SEMANTIC", "not-a-number")
+        assert MatchConfig.get_min_semantic() == 0.0
+
+
+class TestEmbeddingStorage:
+    """Tests for packed embedding storage in the cache"""
+    
+    def test_packed_embedding_round_trip(self):
+        """Test that packed embeddings decode close enough for cosine similarity"""
+        from app.services.embeddings.cache import pack_embedding, unpack_embedding
+        
+        embedding = [0.0123, -0.0456, 0.0789, 0.25, -0.5]
+        stored = pack_embedding(embedding)
+        
+        assert len(stored) == 2 * len(embedding)
+        restored = unpack_embedding(bytes(stored))
+        assert restored.dtype == np.float32
+        assert restored.tolist() == pytest.approx(embedding, rel=1e-3)
+        assert ScoringUtils.cosine_similarity_score(embedding, restored) > 0.9999
+    
+    def test_legacy_list_embedding_passthrough(self):
+        """Test that embeddings stored as plain lists decode to the same float32 array"""
+        from app.services.embeddings.cache import unpack_embedding
+        
+        embedding = [0.1, 0.2, 0.3]
+        restored = unpack_embedding(embedding)
+        assert restored.dtype == np.float32
+        assert restored.tolist() == pytest.approx(embedding)
+    
+    @pytest.mark.asyncio
+    async def test_get_or_compute_batch_dedupes_misses(self):
+        """Test that duplicate texts are computed and stored once, in input order"""
+        from app.services.embeddings.cache import EmbeddingCache
+        
+        cache = EmbeddingCache.__new__(EmbeddingCache)
+        cache.get_batch = AsyncMock(return_value={"a": np.array([1.0], dtype=np.float32), "b": None})
+        cache.set_batch = AsyncMock()
+        compute_fn = AsyncMock(return_value=[[2.0]])
+        
+        result = await cache.get_or_compute_batch(["b", "a", "b"], "model", compute_fn)
+        
+        assert [embedding.tolist() for embedding in result] == [[2.0], [1.0], [2.0]]
+        assert all(embedding.dtype == np.float32 for embedding in result)
+        cache.get_batch.assert_awaited_once_with(["b", "a"], "model")
+        compute_fn.assert_awaited_once_with(["b"])
+        cache.set_batch.assert_awaited_once_with(["b"], "model", [[2.0]])
+
+
+class TestMatchGeneration:
+    """Tests for match generation with precomputed profile inputs"""
+    
+    @pytest.mark.asyncio
+    async def test_generate_match_reuses_precomputed_profile_inputs(self, sample_profile, sample_job):
+        """Test that a recompute batch's profile embedding and skills are reused per job"""
+        from app.services.matching.match_service import MatchGenerationService
+        
+        service = MatchGenerationService.__new__(MatchGenerationService)
+        service.weights = MatchConfig.get_weights()
+        service.embedding_provider = Mock()
+        service.embedding_provider.get_model_name.return_value = "test-model"
+        service.create_profile_embedding = AsyncMock()
+        service.create_job_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        
+        user_skills = ScoringUtils.get_user_skills(sample_profile)
+        user_seniority = ScoringUtils.infer_user_seniority(sample_profile)
+        match = await service.generate_match(
+            sample_profile, "profile1", sample_job,
+            profile_embedding=[0.1, 0.2, 0.3],
+            user_skills=user_skills,
+            user_seniority=user_seniority,
+        )
+        
+        service.create_profile_embedding.assert_not_awaited()
+        expected_total, expected_breakdown = service.compute_match_score(
+            sample_profile, sample_job, [0.1, 0.2, 0.3], [0.1, 0.2, 0.3]
+        )
+        assert match.score_total == pytest.approx(expected_total)
+        assert match.score_breakdown == expected_breakdown
+    
+    @pytest.mark.asyncio
+    async def test_generate_match_derives_job_inputs_once(self, sample_profile, sample_job, monkeypatch):
+        """Test that job skills and seniority are shared by scoring and explainability"""
+        from app.services.matching.match_service import MatchGenerationService
+        
+        service = MatchGenerationService.__new__(MatchGenerationService)
+        service.weights = MatchConfig.get_weights()
+        service.embedding_provider = Mock()
+        service.embedding_provider.get_model_name.return_value = "test-model"
+        
+        expected_reasons, expected_gaps, _ = service.generate_explainability(
+            sample_profile, sample_job,
+            service.compute_match_score(sample_profile, sample_job, [], None, semantic=0.8)[1]
+        )
+        
+        extract_skills = Mock(wraps=ScoringUtils.extract_skills_from_job)
+        infer_seniority = Mock(wraps=ScoringUtils.infer_seniority_from_title)
+        monkeypatch.setattr(ScoringUtils, "extract_skills_from_job", extract_skills)
+        monkeypatch.setattr(ScoringUtils, "infer_seniority_from_title", infer_seniority)
+        
+        # Profile seniority is inferred from role titles too; precompute it
+        # so only the job's own title is counted
+        user_seniority = ScoringUtils.infer_user_seniority(sample_profile)
+        infer_seniority.reset_mock()
+        
+        match = await service.generate_match(
+            sample_profile, "profile1", sample_job,
+            profile_embedding=[0.1, 0.2, 0.3],
+            user_seniority=user_seniority,
+            semantic=0.8,
+        )
+        
+        extract_skills.assert_called_once_with(sample_job)
+        infer_seniority.assert_called_once_with(sample_job.title)
+        assert match.top_reasons == expected_reasons
+        assert match.gaps == expected_gaps
+        
+    @pytest.mark.asyncio
+    async def test_create_job_embeddings_batches_through_cache(self, sample_job):
+        """Test that job embeddings are fetched and computed as one batch"""
+        from app.services.matching.match_service import MatchGenerationService
+        
+        service = MatchGenerationService.__new__(MatchGenerationService)
+        service.embedding_provider = Mock()
+        service.embedding_provider.get_model_name.return_value = "test-model"
+        service.embedding_cache = Mock()
+        service.embedding_cache.get_or_compute_batch = AsyncMock(return_value=[[0.1], [0.1]])
+        
+        embeddings = await service.create_job_embeddings([sample_job, sample_job])
+        
+        assert embeddings == [[0.1], [0.1]]
+        texts, model, compute_fn = service.embedding_cache.get_or_compute_batch.await_args.args
+        assert texts == [service._job_embedding_text(sample_job)] * 2
+        assert model == "test-model"
+        assert compute_fn is service.embedding_provider.get_embeddings
+    
+    @pytest.mark.asyncio
+    async def test_resolve_job_embeddings_prefers_stored_vectors(self, sample_job):
+        """Test that stored job embeddings are reused and new ones written back"""
+        from app.services.embeddings.cache import pack_embedding
+        from app.services.matching.match_service import MatchGenerationService
+        
+        other_job = sample_job.model_copy(update={"id": "507f1f77bcf86cd799439012"})
+        service = MatchGenerationService.__new__(MatchGenerationService)
+        service.embedding_provider = Mock()
+        service.embedding_provider.get_model_name.return_value = "test-model"
+        service.create_job_embeddings = AsyncMock(return_value=[[0.5, 0.5]])
+        service.jobs_collection = Mock()
+        service.jobs_collection.bulk_write = AsyncMock()
+        
+        embeddings = await service.resolve_job_embeddings(
+            [sample_job, other_job],
+            [bytes(pack_embedding([0.25, -0.5])), None],
+        )
+        
+        assert embeddings.dtype == np.float32
+        assert embeddings.tolist() == [[0.25, -0.5], [0.5, 0.5]]
+        service.create_job_embeddings.assert_awaited_once_with([other_job])
+        ops = service.jobs_collection.bulk_write.await_args.args[0]
+        assert len(ops) == 1
+    
+    @pytest.mark.asyncio
+    async def test_recompute_skips_jobs_below_semantic_threshold(self, sample_profile, sample_job, monkeypatch):
+        """Test that low-similarity jobs are not scored and their old matches are removed"""
+        import app.models.database as database
+        from bson import ObjectId
+        from app.services.matching.match_service import MatchGenerationService
+        
+        profile_id = str(ObjectId())
+        profiles_collection = Mock()
+        profiles_collection.find_one = AsyncMock(return_value=sample_profile.model_dump())
+        monkeypatch.setattr(database, "get_profiles_collection", lambda: profiles_collection)
+        
+        other_job = sample_job.model_copy(update={"id": "507f1f77bcf86cd799439012"})
+        job_docs = [
+            {**job.model_dump(exclude={"id"}), "_id": ObjectId(job.id)}
+            for job in (sample_job, other_job)
+        ]
+        
+        class Cursor:
+            def batch_size(self, size):
+                return self
+            
+            async def __aiter__(self):
+                for doc in job_docs:
+                    yield doc
+        
+        service = MatchGenerationService.__new__(MatchGenerationService)
+        service.weights = MatchConfig.get_weights()
+        service.min_semantic = 0.5
+        service.embedding_provider = Mock()
+        service.embedding_provider.get_model_name.return_value = "test-model"
+        service.create_profile_embedding = AsyncMock(return_value=np.array([1.0, 0.0], dtype=np.float32))
+        service.resolve_job_embeddings = AsyncMock(
+            return_value=np.array([[1.0, 0.0], [-1.0, 0.0]], dtype=np.float32)
+        )
+        service.jobs_collection = Mock()
+        service.jobs_collection.find.return_value = Cursor()
+        service.matches_collection = Mock()
+        service.matches_collection.bulk_write = AsyncMock()
+        service.matches_collection.delete_many = AsyncMock()
+        
+        computed = await service.recompute_all_matches(profile_id)
+        
+        assert computed == 1
+        ops = service.matches_collection.bulk_write.await_args.args[0]
+        assert [op._filter["job_id"] for op in ops] == [sample_job.id]
+        service.matches_collection.delete_many.assert_awaited_once_with({
+            "profile_id": profile_id,
+            "job_id": {"$in": [other_job.id]},
+        })
+
+
+class TestMatchEndpoints:
+    """Tests for match endpoints that return job details"""
+    
+    @pytest.fixture
+    def stored_documents(self, sample_job):
+        """Create a stored match and its job document carrying a packed embedding"""
+        from bson import ObjectId
+        from app.services.embeddings.cache import pack_embedding
+        
+        profile_id = ObjectId()
+        job_doc = {
+            **sample_job.model_dump(exclude={"id"}),
+            "_id": ObjectId(sample_job.id),
+            "embedding_vec": pack_embedding([0.1] * 1536),
+            "embedding_model": "test-model",
+        }
+        match_doc = {
+            "_id": ObjectId(),
+            "profile_id": str(profile_id),
+            "job_id": sample_job.id,
+            "score_total": 0.8,
+            "score_breakdown": {"semantic": 0.8},
+        }
+        return profile_id, job_doc, match_doc
+    
+    @staticmethod
+    def _patch_collections(monkeypatch, profile_id, job_doc, match_doc):
+        """Point the matches router at mock collections; jobs honour exclusion projections"""
+        import app.routers.matches as matches_router
+        
+        async def find_job(query, projection=None):
+            doc = dict(job_doc)
+            for field, include in (projection or {}).items():
+                if not include:
+                    doc.pop(field, None)
+            return doc
+        
+        profiles_collection = Mock()
+        profiles_collection.find_one = AsyncMock(return_value={"_id": profile_id})
+        jobs_collection = Mock()
+        jobs_collection.find_one = AsyncMock(side_effect=find_job)
+        matches_collection = Mock()
+        matches_collection.find_one = AsyncMock(return_value=dict(match_doc))
+        matches_collection.count_documents = AsyncMock(return_value=1)
+        cursor = matches_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        cursor.to_list = AsyncMock(return_value=[dict(match_doc)])
+        
+        monkeypatch.setattr(matches_router, "get_profiles_collection", lambda: profiles_collection)
+        monkeypatch.setattr(matches_router, "get_jobs_collection", lambda: jobs_collection)
+        monkeypatch.setattr(matches_router, "get_matches_collection", lambda: matches_collection)
+        return jobs_collection
+    
+    @pytest.mark.asyncio
+    async def test_get_match_excludes_stored_embedding(self, stored_documents, monkeypatch):
+        """Test that a job's packed embedding is not returned with its match"""
+        from app.routers.matches import get_match
+        
+        profile_id, job_doc, match_doc = stored_documents
+        jobs_collection = self._patch_collections(monkeypatch, profile_id, job_doc, match_doc)
+        
+        response = await get_match(match_doc["job_id"])
+        
+        assert response.job["title"] == job_doc["title"]
+        assert "embedding_vec" not in response.job
+        assert jobs_collection.find_one.await_args.kwargs["projection"] == {"embedding_vec": 0}
+    
+    @pytest.mark.asyncio
+    async def test_list_matches_excludes_stored_embedding(self, stored_documents, monkeypatch):
+        """Test that listed matches carry job details without the packed embedding"""
+        from app.routers.matches import list_matches
+        
+        profile_id, job_doc, match_doc = stored_documents
+        self._patch_collections(monkeypatch, profile_id, job_doc, match_doc)
+        
+        response = await list_matches(
+            min_score=None, remote=None, europe=None, country=None,
+            city=None, skill_tag=None, page=1, per_page=50,
+        )
+        
+        assert len(response.matches) == 1
+        job = response.matches[0].job
+        assert job["id"] == match_doc["job_id"]
+        assert "embedding_vec" not in job
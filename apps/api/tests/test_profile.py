@@ -0,0 +1,19 @@
+"""Tests for profile endpoints"""
+import pytest
+from httpx import AsyncClient
+from app.main import app
+
+
+@pytest.mark.asyncio
+class TestProfileEndpoints:
+    """Test profile endpoints that don't require a database"""
+    
+    async def test_upload_cv_unsupported_format(self):
+        """Test unsupported file formats are rejected with 400, not 500"""
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            response = await client.post(
+                "/profile/upload-cv",
+                files={"file": ("resume.txt", b"plain text", "text/plain")}
+            )
+            
+            assert response.status_code == 400
@@ -2,7 +2,14 @@
 import pytest
 import asyncio
 from datetime import datetime
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import (
+    SSEEvent,
+    JOB_CREATED,
+    JOB_PROGRESS,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    APPLICATION_STATUS_CHANGE,
+)
 from app.services.sse_service import SSEService
 
 
@@ -19,7 +26,7 @@ class TestSSEService:
         
         # Emit an event
         event = SSEEvent(
-            event_type=EventType.JOB_CREATED,
+            event_type=JOB_CREATED,
             data={"job_id": "123", "type": "job_ingestion"},
             user_id="test_user"
         )
@@ -28,8 +35,8 @@ class TestSSEService:
         # Check that event was received
         received_event = await asyncio.wait_for(queue.get(), timeout=1.0)
         
-        assert received_event.event_type == EventType.JOB_CREATED
-        assert received_event.data["job_id"] == "123"
+        assert received_event["type"] == JOB_CREATED
+        assert received_event["data"]["job_id"] == "123"
         
         # Cleanup
         service.unsubscribe(queue, user_id="test_user")
@@ -44,7 +51,7 @@ class TestSSEService:
         
         # Emit an event
         event = SSEEvent(
-            event_type=EventType.JOB_PROGRESS,
+            event_type=JOB_PROGRESS,
             data={"job_id": "456", "progress": 50},
             user_id="user1"
         )
@@ -54,8 +61,8 @@ class TestSSEService:
         event1 = await asyncio.wait_for(queue1.get(), timeout=1.0)
         event2 = await asyncio.wait_for(queue2.get(), timeout=1.0)
         
-        assert event1.data["progress"] == 50
-        assert event2.data["progress"] == 50
+        assert event1["data"]["progress"] == 50
+        assert event2["data"]["progress"] == 50
         
         # Cleanup
         service.unsubscribe(queue1, user_id="user1")
@@ -71,7 +78,7 @@ class TestSSEService:
         
         # Emit event for user1
         event = SSEEvent(
-            event_type=EventType.JOB_COMPLETED,
+            event_type=JOB_COMPLETED,
             data={"job_id": "789"},
             user_id="user1"
         )
@@ -80,7 +87,7 @@ class TestSSEService:
         # Only user1 should receive it
         try:
             event1 = await asyncio.wait_for(queue_user1.get(), timeout=1.0)
-            assert event1.data["job_id"] == "789"
+            assert event1["data"]["job_id"] == "789"
         except asyncio.TimeoutError:
             pytest.fail("User1 should have received the event")
         
@@ -102,11 +109,11 @@ class TestSSEService:
         
         # Test all event types
         event_types = [
-            EventType.JOB_CREATED,
-            EventType.JOB_PROGRESS,
-            EventType.JOB_COMPLETED,
-            EventType.JOB_FAILED,
-            EventType.APPLICATION_STATUS_CHANGE,
+            JOB_CREATED,
+            JOB_PROGRESS,
+            JOB_COMPLETED,
+            JOB_FAILED,
+            APPLICATION_STATUS_CHANGE,
         ]
         
         for event_type in event_types:
@@ -117,7 +124,7 @@ class TestSSEService:
             await service.emit(event)
             
             received = await asyncio.wait_for(queue.get(), timeout=1.0)
-            assert received.event_type == event_type
+            assert received["type"] == event_type
         
         # Cleanup
         service.unsubscribe(queue)
@@ -125,7 +132,7 @@ class TestSSEService:
     async def test_event_payload_format(self):
         """Test that event payloads have required fields"""
         event = SSEEvent(
-            event_type=EventType.JOB_PROGRESS,
+            event_type=JOB_PROGRESS,
             data={
                 "job_id": "123",
                 "type": "job_ingestion",
@@ -136,8 +143,54 @@ class TestSSEService:
         )
         
         # Validate structure
-        assert event.event_type == EventType.JOB_PROGRESS
+        assert event.event_type == JOB_PROGRESS
         assert "job_id" in event.data
         assert "progress" in event.data
         assert event.timestamp is not None
         assert isinstance(event.timestamp, datetime)
+    
+    async def test_event_type_formats_as_wire_name(self):
+        """Test that event types render as their wire names in SSE frames"""
+        event = SSEEvent(event_type=JOB_CREATED, data={})
+        
+        assert f"event: {event.event_type}" == "event: job.created"
+    
+    async def test_emit_plain_dict_event(self):
+        """Test that internal producers can emit a plain dict and get a timestamp"""
+        service = SSEService()
+        queue = service.subscribe(user_id="test_user")
+        
+        await service.emit({
+            "type": JOB_PROGRESS,
+            "data": {"job_id": "123", "progress": 10},
+            "user_id": "test_user",
+        })
+        
+        received = await asyncio.wait_for(queue.get(), timeout=1.0)
+        
+        assert received["type"] == JOB_PROGRESS
+        assert isinstance(received["timestamp"], datetime)
+        
+        service.unsubscribe(queue, user_id="test_user")
+    
+    async def test_stream_events_frame(self):
+        """Test that queued events are framed as SSE with a JSON payload"""
+        service = SSEService()
+        stream = service.stream_events(user_id="test_user")
+        
+        connected = await stream.__anext__()
+        assert connected.startswith('data: {"type":"connected"')
+        
+        await service.emit({
+            "type": JOB_COMPLETED,
+            "data": {"job_id": "123"},
+            "timestamp": datetime(2024, 1, 1, 12, 0),
+            "user_id": "test_user",
+        })
+        
+        assert await stream.__anext__() == "event: job.completed\n"
+        payload = await stream.__anext__()
+        assert '"timestamp":"2024-01-01T12:00:00"' in payload
+        assert payload.endswith("\n\n")
+        
+        await stream.aclose()
@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'api'))
 from app.schemas.job_queue import BackgroundJobInDB
 from app.services.job_service import JobService
 from app.services.sse_service import SSEService
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_PROGRESS
 from app.services.interview_prep import InterviewPrepService
 from app.models.database import (
     get_packets_collection,
@@ -43,16 +43,16 @@ async def handle_interview_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 10, "Loading packet data...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 10,
             "message": "Loading packet data..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Get packet, profile, and job
     packets_col = get_packets_collection()
@@ -65,7 +65,7 @@ async def handle_interview_generation(
     if not packet_doc:
         raise ValueError(f"Packet {packet_id} not found")
     
-    packet = PacketInDB(**packet_doc)
+    packet = PacketInDB.from_mongo(packet_doc)
     
     profile_doc = await profiles_col.find_one({})
     if not profile_doc:
@@ -77,20 +77,20 @@ async def handle_interview_generation(
     if not job_doc:
         raise ValueError(f"Job {packet.job_id} not found")
     
-    job_posting = JobPostingInDB(**job_doc)
+    job_posting = JobPostingInDB.from_mongo(job_doc)
     
     # Update progress
     await job_service.update_progress(job.id, 30, "Generating interview pack...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 30,
             "message": "Generating interview pack..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Generate interview materials
     service = InterviewPrepService()
@@ -99,31 +99,31 @@ async def handle_interview_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 60, "Generating technical Q&A...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 60,
             "message": "Generating technical Q&A..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     technical_qa = await service.generate_technical_qa(profile, job_posting, packet)
     
     # Update progress
     await job_service.update_progress(job.id, 85, "Saving to database...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 85,
             "message": "Saving to database..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Store in database
     interview_pack_dict = interview_pack.model_dump()
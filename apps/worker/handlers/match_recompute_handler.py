@@ -10,7 +10,7 @@ from app.schemas.job_queue import BackgroundJobInDB
 from app.services.job_service import JobService
 from app.services.sse_service import SSEService
 from app.services.matching.match_service import MatchGenerationService
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_PROGRESS
 
 logger = logging.getLogger(__name__)
 
@@ -33,47 +33,47 @@ async def handle_match_recompute(
     
     # Update progress
     await job_service.update_progress(job.id, 10, "Initializing match computation...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 10,
             "message": "Initializing match computation..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Recompute matches
     service = MatchGenerationService()
     
     # Update progress
     await job_service.update_progress(job.id, 30, "Computing matches...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 30,
             "message": "Computing matches..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     matches_computed = await service.recompute_all_matches(profile_id)
     
     # Update progress
     await job_service.update_progress(job.id, 90, "Finalizing...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 90,
             "message": "Finalizing..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     logger.info(f"Match recompute completed: {matches_computed} matches")
     
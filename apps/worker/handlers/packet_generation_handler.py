@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'api'))
 from app.schemas.job_queue import BackgroundJobInDB
 from app.services.job_service import JobService
 from app.services.sse_service import SSEService
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.sse import JOB_PROGRESS
 from app.services.tailoring import TailoringService
 from app.services.packet_storage import PacketStorageService
 from app.models.database import get_profiles_collection, get_jobs_collection
@@ -41,16 +41,16 @@ async def handle_packet_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 10, "Loading profile and job data...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 10,
             "message": "Loading profile and job data..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Get profile and job
     profiles_collection = get_profiles_collection()
@@ -71,16 +71,16 @@ async def handle_packet_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 30, "Generating tailoring plan...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 30,
             "message": "Generating tailoring plan..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Generate tailoring plan
     tailoring_service = TailoringService()
@@ -95,16 +95,16 @@ async def handle_packet_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 50, "Rendering LaTeX CV...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 50,
             "message": "Rendering LaTeX CV..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Generate packet ID
     temp_id = f"temp_{int(datetime.utcnow().timestamp())}"
@@ -122,16 +122,16 @@ async def handle_packet_generation(
     
     # Update progress
     await job_service.update_progress(job.id, 70, "Compiling PDF...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 70,
             "message": "Compiling PDF..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     # Try to compile to PDF
     cv_pdf = None
@@ -148,16 +148,16 @@ async def handle_packet_generation(
     
     # Generate other materials
     await job_service.update_progress(job.id, 85, "Generating application materials...")
-    await sse_service.emit(SSEEvent(
-        event_type=EventType.JOB_PROGRESS,
-        data={
+    await sse_service.emit({
+        "type": JOB_PROGRESS,
+        "data": {
             "job_id": job.id,
             "type": job.type,
             "progress": 85,
             "message": "Generating application materials..."
         },
-        user_id=job.user_id
-    ))
+        "user_id": job.user_id
+    })
     
     recruiter_message = tailoring_service.generate_recruiter_message(profile, job_posting, plan)
     common_answers = tailoring_service.generate_common_answers(profile, job_posting, plan)
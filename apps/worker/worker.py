@@ -2,11 +2,14 @@
 Background worker for processing jobs
 """
 import asyncio
+import gc
 import logging
 import os
+import queue
 import sys
 import uuid
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 # Add parent directory to path to import from api
@@ -19,8 +22,14 @@ from app.config import config
 from app.models.database import Database
 from app.services.job_service import JobService
 from app.services.sse_service import sse_service
-from app.schemas.job_queue import JobType, BackgroundJobInDB
-from app.schemas.sse import SSEEvent, EventType
+from app.schemas.job_queue import (
+    BackgroundJobInDB,
+    JOB_INGESTION,
+    MATCH_RECOMPUTE,
+    PACKET_GENERATION,
+    INTERVIEW_GENERATION,
+)
+from app.schemas.sse import JOB_PROGRESS, JOB_COMPLETED, JOB_FAILED
 
 # Import handlers
 from handlers.job_ingestion_handler import handle_job_ingestion
@@ -28,11 +37,15 @@ from handlers.match_recompute_handler import handle_match_recompute
 from handlers.packet_generation_handler import handle_packet_generation
 from handlers.interview_generation_handler import handle_interview_generation
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(worker_id)s] %(message)s'
-)
+# Configure logging; records are queued and written by a listener thread so
+# log I/O never blocks the event loop
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(worker_id)s] %(message)s'
+))
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _log_handler)
 logger = logging.getLogger(__name__)
 
 
@@ -47,10 +60,10 @@ class Worker:
         
         # Map job types to handlers
         self.handlers = {
-            JobType.JOB_INGESTION: handle_job_ingestion,
-            JobType.MATCH_RECOMPUTE: handle_match_recompute,
-            JobType.PACKET_GENERATION: handle_packet_generation,
-            JobType.INTERVIEW_GENERATION: handle_interview_generation,
+            JOB_INGESTION: handle_job_ingestion,
+            MATCH_RECOMPUTE: handle_match_recompute,
+            PACKET_GENERATION: handle_packet_generation,
+            INTERVIEW_GENERATION: handle_interview_generation,
         }
     
     async def start(self):
@@ -89,17 +102,17 @@ class Worker:
             logger.info(f"Acquired job {job.id} of type {job.type}")
             
             # Emit job started event
-            await sse_service.emit(SSEEvent(
-                event_type=EventType.JOB_PROGRESS,
-                data={
+            await sse_service.emit({
+                "type": JOB_PROGRESS,
+                "data": {
                     "job_id": job.id,
                     "type": job.type,
                     "status": "running",
                     "progress": 0,
                     "message": f"Job started"
                 },
-                user_id=job.user_id
-            ))
+                "user_id": job.user_id
+            })
             
             # Execute the job
             try:
@@ -120,9 +133,9 @@ class Worker:
                 logger.info(f"Job {job.id} completed successfully")
                 
                 # Emit completion event
-                await sse_service.emit(SSEEvent(
-                    event_type=EventType.JOB_COMPLETED,
-                    data={
+                await sse_service.emit({
+                    "type": JOB_COMPLETED,
+                    "data": {
                         "job_id": job.id,
                         "type": job.type,
                         "status": "succeeded",
@@ -130,8 +143,8 @@ class Worker:
                         "message": result.get("message", "Job completed"),
                         "result": result.get("result")
                     },
-                    user_id=job.user_id
-                ))
+                    "user_id": job.user_id
+                })
                 
             except Exception as e:
                 error_msg = str(e)
@@ -144,16 +157,16 @@ class Worker:
                 )
                 
                 # Emit failure event
-                await sse_service.emit(SSEEvent(
-                    event_type=EventType.JOB_FAILED,
-                    data={
+                await sse_service.emit({
+                    "type": JOB_FAILED,
+                    "data": {
                         "job_id": job.id,
                         "type": job.type,
                         "status": "failed",
                         "error": error_msg
                     },
-                    user_id=job.user_id
-                ))
+                    "user_id": job.user_id
+                })
             
             finally:
                 self.current_job = None
@@ -188,4 +201,12 @@ if __name__ == "__main__":
     
     logging.setLogRecordFactory(record_factory)
     
-    asyncio.run(main())
+    # Move import-time objects (modules, pydantic schema validators) into the
+    # permanent generation so the GC stops rescanning them on every full pass
+    gc.freeze()
+    
+    _log_listener.start()
+    try:
+        asyncio.run(main())
+    finally:
+        _log_listener.stop()